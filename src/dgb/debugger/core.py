@@ -11,7 +11,7 @@ from dgb.debugger import win32api
 from dgb.debugger.state import DebuggerContext, StopInfo
 from dgb.debugger.process_controller import ProcessController
 from dgb.debugger.module_manager import ModuleManager
-from dgb.debugger.breakpoint_manager import BreakpointManager
+from dgb.debugger.breakpoint_manager import Breakpoint, BreakpointManager
 
 
 class Debugger:
@@ -131,6 +131,12 @@ class Debugger:
 
             print(f"[EventLoop] Got event: code={event.dwDebugEventCode}", flush=True)
 
+            # The process has run since the last stop, so anything cached for
+            # that stop is stale. This must happen before dispatching, which
+            # publishes the new stop to other threads (the server's handlers
+            # don't wait for ContinueDebugEvent before inspecting it).
+            self.process_controller.on_resume()
+
             # Process the event
             self._dispatch_event(event)
 
@@ -551,18 +557,18 @@ class Debugger:
 
         print(f"[Debugger.stop] Cleanup complete", flush=True)
 
-    def set_breakpoint(self, location: str) -> bool:
+    def set_breakpoint(self, location: str) -> Optional[Breakpoint]:
         """Set a breakpoint (supports deferred/pending breakpoints).
 
         Args:
             location: Either "file:line", "module.dll:line", or "0xaddress"
 
         Returns:
-            True if successful
+            The breakpoint that was set, or None if it couldn't be set
         """
         if not self.breakpoint_manager:
             print("Process not started")
-            return False
+            return None
 
         # Use deferred breakpoint logic (handles both immediate and pending)
         bp = self.breakpoint_manager.set_breakpoint_deferred(location)
@@ -574,8 +580,8 @@ class Debugger:
                 print(f"Breakpoint {bp.id} set at 0x{bp.address:08x}")
                 if bp.file and bp.line:
                     print(f"  Location: {bp.file}:{bp.line}")
-            return True
-        return False
+            return bp
+        return None
 
     def list_breakpoints(self):
         """List all breakpoints (including pending)."""
@@ -146,8 +146,8 @@ class ModuleManager:
             module.line_info = line_info
             print(f"[Module] {module.name}: DWARF 2 debug info loaded ({parser.get_format_type()})")
 
-            # Show source files
-            files = line_info.get_files()
+            # Show source files (CU names - reading them doesn't decode the line programs)
+            files = line_info.get_unit_names()
             if files:
                 print(f"[Module] {module.name}: {len(files)} source files")
                 for file in sorted(files):
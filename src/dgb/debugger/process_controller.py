@@ -22,6 +22,7 @@ class ProcessController:
         self.process_handle: Optional[int] = None
         self.process_id: Optional[int] = None
         self.thread_handles = {}  # {thread_id: thread_handle}
+        self.stop_generation = 0  # Bumped for every debug event the process raises
 
     def set_process(self, process_handle: int, process_id: int):
         """Set the process handle (called after CREATE_PROCESS event).
@@ -33,6 +34,17 @@ class ProcessController:
         self.process_handle = process_handle
         self.process_id = process_id
 
+    def on_resume(self):
+        """Record that the process has run since the last stop.
+
+        Called by the debug event loop for every event, before the event is
+        dispatched, so it covers every way of resuming (the debugger's own
+        continue/step and the server setting the context running). Bumps
+        stop_generation, so state cached for the previous stop (such as
+        registers and frame bases) can tell that it's stale.
+        """
+        self.stop_generation += 1
+
     def add_thread(self, thread_id: int, thread_handle: int):
         """Add a thread handle.
 
@@ -6,11 +6,36 @@ variables, parameters, and types for variable inspection.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
+from typing import Any, Optional, List, Dict, Tuple
 from elftools.dwarf.dwarfinfo import DWARFInfo
 from elftools.dwarf.die import DIE
 
 
+def _build_location_types() -> tuple:
+    """Build the first-opcode -> location type table used by DIEParser."""
+    location_types = ['unknown'] * 256
+
+    # DW_OP_reg* (0x50-0x6F) - register
+    for opcode in range(0x50, 0x70):
+        location_types[opcode] = 'register'
+
+    # DW_OP_breg* (0x70-0x8F) - base register + offset (usually stack)
+    for opcode in range(0x70, 0x90):
+        location_types[opcode] = 'stack'
+
+    # DW_OP_fbreg (0x91) - frame base relative (stack)
+    location_types[0x91] = 'stack'
+
+    # DW_OP_addr (0x03) - absolute address (global)
+    location_types[0x03] = 'global'
+
+    return tuple(location_types)
+
+
+# Location type of a variable, indexed by the first opcode of its location expression
+_LOCATION_TYPES = _build_location_types()
+
+
 @dataclass
 class SubprogramInfo:
     """Represents a function/subprogram with debug information."""
@@ -35,6 +60,8 @@ class VariableInfo:
     location: Optional[bytes]  # Location expression
     is_parameter: bool  # True for parameters, False for local variables
     die: DIE  # Original DIE for additional attribute access
+    const_value: Optional[Any] = None  # DW_AT_const_value, for optimized-out variables
+    location_type: str = 'unknown'  # 'stack', 'register', 'global' or 'unknown'
 
 
 class DIEParser:
@@ -50,6 +77,8 @@ class DIEParser:
         # Indexes built during initialization
         self.subprograms: List[SubprogramInfo] = []
         self.types: Dict[int, DIE] = {}  # type_offset -> type DIE
+        # Subprogram DIE offset -> its variables, parsed on first request
+        self._variables_cache: Dict[int, List[VariableInfo]] = {}
 
         # Build indexes
         self._build_indexes()
@@ -175,14 +204,20 @@ class DIEParser:
     def get_variables_in_subprogram(self, subprog: SubprogramInfo) -> List[VariableInfo]:
         """Get all variables and parameters in a subprogram.
 
+        The variable DIEs are parsed the first time a subprogram is asked for;
+        later calls return the same list.
+
         Args:
             subprog: Subprogram to extract variables from
 
         Returns:
-            List of VariableInfo objects
+            List of VariableInfo objects (shared - don't modify it)
         """
-        variables = []
+        variables = self._variables_cache.get(subprog.die.offset)
+        if variables is not None:
+            return variables
 
+        variables = []
         try:
             # Recursively collect variables from the subprogram and all lexical blocks
             self._collect_variables_recursive(subprog.die, variables)
@@ -191,6 +226,7 @@ class DIEParser:
             # Return what we have if error occurs
             pass
 
+        self._variables_cache[subprog.die.offset] = variables
         return variables
 
     def _collect_variables_recursive(self, die: DIE, variables: List[VariableInfo]):
@@ -255,12 +291,24 @@ class DIEParser:
             location_attr = attrs.get('DW_AT_location')
             location = location_attr.value if location_attr else None
 
+            # Classify the location by the expression's first opcode (location
+            # lists aren't expressions and stay 'unknown')
+            location_type = 'unknown'
+            if isinstance(location, (list, bytes)) and location:
+                location_type = _LOCATION_TYPES[location[0]]
+
+            # Get constant value (variable optimized out but its value is known)
+            const_value_attr = attrs.get('DW_AT_const_value')
+            const_value = const_value_attr.value if const_value_attr else None
+
             return VariableInfo(
                 name=name,
                 type_offset=type_offset,
                 location=location,
                 is_parameter=is_parameter,
-                die=die
+                die=die,
+                const_value=const_value,
+                location_type=location_type
             )
 
         except Exception:
@@ -4,14 +4,29 @@ Line number information from DWARF debug data.
 Provides bidirectional mapping between addresses and source code locations.
 """
 
+import os
+import sys
+import threading
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Optional
 
 from elftools.dwarf.dwarfinfo import DWARFInfo
 
 
-@dataclass
+def _basename(path: str) -> str:
+    """Get the file name part of a path, accepting both / and \\ separators.
+
+    Cheaper than Path(path).name, and treats Watcom's Windows paths the same
+    way on every host.
+    """
+    i = max(path.rfind('/'), path.rfind('\\'))
+    return path[i + 1:] if i >= 0 else path
+
+
+@dataclass(slots=True, frozen=True)
 class SourceLocation:
     """Represents a source code location."""
 
@@ -32,103 +47,256 @@ class LineInfo:
 
     def __init__(self, dwarf_info: DWARFInfo):
         self.dwarf_info = dwarf_info
-        self._address_to_line_cache = {}  # address -> SourceLocation
+        # Line table stored column-wise, one entry per row, sorted by address:
+        # (addresses, row_ids), where row_ids index into _rows. Replaced as a
+        # whole when units are loaded, so readers never mix two versions.
+        self._table = (array('Q'), array('I'))
+        # Distinct (file_id, line, column) rows, shared by every address that maps to them
+        self._rows = []
+        self._row_index = {}  # (file_id, line, column) -> row_id
+        self._files = []  # file_id -> file path
+        self._file_ids = {}  # file path -> file_id
         self._line_to_address_cache = {}  # (file, line) -> address
-        self._build_cache()
-
-    def _build_cache(self):
-        """Build lookup caches from DWARF line program."""
+        self._by_basename = {}  # basename -> {line: address}
+        self._by_basename_lower = {}  # lowercased basename -> {line: address}
+        # Per-instance memo for address lookups (the same EIP is resolved repeatedly while stepping)
+        self._address_lookup = lru_cache(maxsize=4096)(self._find_address)
+
+        # Line programs are decoded lazily, one compilation unit at a time
+        self._pending_units = {}  # cu_offset -> (low_pc, high_pc, name, CU)
+        self._unit_names = []  # DW_AT_name of every compilation unit
+        self._unit_ranges = []  # (low_pc, high_pc) of CUs that declare one
+        self._load_lock = threading.Lock()
+        self._index_units()
+
+    def _index_units(self):
+        """Record compilation units without decoding their line programs.
+
+        Only each CU's top DIE is read here (name and PC range). Watcom does not
+        emit DW_AT_low_pc/DW_AT_high_pc on CUs, so those units are loaded by
+        the first address query instead of by range.
+        """
         for CU in self.dwarf_info.iter_CUs():
             try:
-                # Get line program for this compilation unit
-                lineprog = self.dwarf_info.line_program_for_CU(CU)
-                if not lineprog:
+                attrs = CU.get_top_DIE().attributes
+
+                name_attr = attrs.get('DW_AT_name')
+                name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else None
+
+                low_pc = high_pc = None
+                low_pc_attr = attrs.get('DW_AT_low_pc')
+                high_pc_attr = attrs.get('DW_AT_high_pc')
+                if low_pc_attr and high_pc_attr:
+                    low_pc = low_pc_attr.value
+                    # high_pc can be absolute address or offset from low_pc
+                    if high_pc_attr.form in ('DW_FORM_data1', 'DW_FORM_data2',
+                                             'DW_FORM_data4', 'DW_FORM_data8'):
+                        high_pc = low_pc + high_pc_attr.value
+                    else:
+                        high_pc = high_pc_attr.value
+            except Exception:
+                # Skip CUs with corrupted data (no line program can be read either)
+                continue
+
+            self._pending_units[CU.cu_offset] = (low_pc, high_pc, name, CU)
+            if name:
+                self._unit_names.append(name)
+            if low_pc is not None:
+                self._unit_ranges.append((low_pc, high_pc))
+
+    def _load_units(self, cu_offsets):
+        """Decode the line programs of pending units and merge them into the caches.
+
+        Args:
+            cu_offsets: Offsets of the compilation units to load
+        """
+        with self._load_lock:
+            offsets = [offset for offset in list(cu_offsets) if offset in self._pending_units]
+            if not offsets:
+                return
+
+            # address -> row_id (later rows win, as in the line program)
+            rows = dict(zip(*self._table))
+
+            for offset in offsets:
+                self._build_cu_cache(self._pending_units[offset][3], rows)
+
+            # Freeze into sorted columns for binary search
+            addresses = sorted(rows)
+            self._table = (array('Q', addresses), array('I', [rows[address] for address in addresses]))
+            self._address_lookup.cache_clear()
+
+            # Only now mark the units loaded: a thread that finds nothing pending
+            # goes straight to a lookup, so the new table must already be in place.
+            # Threads that still see them pending wait on the lock above instead.
+            for offset in offsets:
+                del self._pending_units[offset]
+
+    def _load_all_units(self):
+        """Load every compilation unit that hasn't been decoded yet."""
+        if self._pending_units:
+            self._load_units(self._pending_units.keys())
+
+    def _load_units_for_address(self, address: int):
+        """Load the compilation units that can contain rows for an address."""
+        if not self._pending_units:
+            return
+
+        if any(low_pc <= address < high_pc for low_pc, high_pc in self._unit_ranges):
+            # Units without a range may contain anything; ranged units only if they cover the address
+            offsets = [offset for offset, (low_pc, high_pc, _, _) in list(self._pending_units.items())
+                       if low_pc is None or low_pc <= address < high_pc]
+        else:
+            # Address is in a gap - the closest preceding row can be in any unit below it
+            offsets = [offset for offset, (low_pc, _, _, _) in list(self._pending_units.items())
+                       if low_pc is None or low_pc <= address]
+
+        self._load_units(offsets)
+
+    def _load_units_for_file(self, file: str):
+        """Load the compilation units whose DW_AT_name matches a file's basename."""
+        if not self._pending_units:
+            return
+
+        file_basename_lower = _basename(file).lower()
+        self._load_units([offset for offset, (_, _, name, _) in list(self._pending_units.items())
+                          if name and _basename(name).lower() == file_basename_lower])
+
+    def _build_cu_cache(self, CU, rows: dict):
+        """Build lookup caches from one compilation unit's DWARF line program.
+
+        Args:
+            CU: Compilation unit to decode
+            rows: address -> row_id dict to add rows to
+        """
+        try:
+            # Get line program for this compilation unit
+            lineprog = self.dwarf_info.line_program_for_CU(CU)
+            if not lineprog:
+                return
+
+            # Build file paths on-demand during iteration
+            # NOTE: pyelftools lazy-loads file_entry, so we can't check if empty
+            # before iterating. Access it inside the loop after it's populated.
+            file_paths_cache = {}
+
+            # Per-CU values needed to build paths, decoded the first time they're needed
+            comp_dir_str = None
+            include_dir_strs = None
+            cu_name_str = None
+
+            # Process line program entries
+            prev_state = None
+            for entry in lineprog.get_entries():
+                state = entry.state
+                if state is None:
+                    continue
+
+                if state.end_sequence:
+                    prev_state = None
                     continue
 
-                # Build file paths on-demand during iteration
-                # NOTE: pyelftools lazy-loads file_entry, so we can't check if empty
-                # before iterating. Access it inside the loop after it's populated.
-                file_paths_cache = {}
-
-                # Process line program entries
-                prev_state = None
-                for entry in lineprog.get_entries():
-                    state = entry.state
-                    if state is None:
-                        continue
-
-                    if state.end_sequence:
-                        prev_state = None
-                        continue
-
-                    # Build file path on-demand (pyelftools has now populated file_entry)
-                    file_index = state.file - 1  # Convert to 0-based
-
-                    if file_index not in file_paths_cache:
-                        # Access file_entries NOW (after iteration started - will be populated!)
-                        file_entries = lineprog.header.get('file_entry', [])
-                        include_dirs = lineprog.header.get('include_directory', [])
-
-                        if 0 <= file_index < len(file_entries):
-                            # Build full path from file_entry
-                            file_entry = file_entries[file_index]
-                            file_name = file_entry.name.decode('utf-8', errors='ignore')
-                            dir_index = file_entry.dir_index
-
-                            if dir_index == 0:
-                                # Current directory - use CU's compilation directory
-                                try:
-                                    comp_dir = CU.get_top_DIE().attributes.get('DW_AT_comp_dir')
-                                    if comp_dir:
-                                        comp_dir_str = comp_dir.value.decode('utf-8', errors='ignore')
-                                        full_path = str(Path(comp_dir_str) / file_name)
-                                    else:
-                                        full_path = file_name
-                                except Exception:
-                                    full_path = file_name
-                            elif 0 < dir_index <= len(include_dirs):
+                # Build file path on-demand (pyelftools has now populated file_entry)
+                file_index = state.file - 1  # Convert to 0-based
+
+                # Paths are interned so rows from every CU share one string per file
+                if file_index not in file_paths_cache:
+                    # Access file_entries NOW (after iteration started - will be populated!)
+                    file_entries = lineprog.header.get('file_entry', [])
+
+                    if 0 <= file_index < len(file_entries):
+                        # Build full path from file_entry
+                        file_entry = file_entries[file_index]
+                        file_name = file_entry.name.decode('utf-8', errors='ignore')
+                        dir_index = file_entry.dir_index
+
+                        if dir_index == 0:
+                            # Current directory - use CU's compilation directory
+                            if comp_dir_str is None:
+                                comp_dir_str = self._get_unit_string(CU, 'DW_AT_comp_dir')
+                            full_path = os.path.join(comp_dir_str, file_name) if comp_dir_str else file_name
+                        else:
+                            if include_dir_strs is None:
+                                include_dir_strs = [
+                                    inc_dir.decode('utf-8', errors='ignore')
+                                    for inc_dir in lineprog.header.get('include_directory', [])
+                                ]
+                            if 0 < dir_index <= len(include_dir_strs):
                                 # Use include directory
-                                inc_dir = include_dirs[dir_index - 1].decode('utf-8', errors='ignore')
-                                full_path = str(Path(inc_dir) / file_name)
+                                full_path = os.path.join(include_dir_strs[dir_index - 1], file_name)
                             else:
                                 full_path = file_name
 
-                            file_paths_cache[file_index] = full_path
-                        else:
-                            # Fallback to Watcom format: use CU name
-                            try:
-                                top_die = CU.get_top_DIE()
-                                cu_name = top_die.attributes.get('DW_AT_name')
-                                if cu_name:
-                                    file_paths_cache[file_index] = cu_name.value.decode('utf-8', errors='ignore')
-                                else:
-                                    file_paths_cache[file_index] = "unknown"
-                            except Exception:
-                                file_paths_cache[file_index] = "unknown"
-
-                    file_path = file_paths_cache[file_index]
-
-                    # Create source location
-                    loc = SourceLocation(
-                        file=file_path,
-                        line=state.line,
-                        column=state.column,
-                        address=state.address
-                    )
-
-                    # Add to caches
-                    self._address_to_line_cache[state.address] = loc
-
-                    # For line-to-address, use the first address for each line
-                    key = (file_path, state.line)
-                    if key not in self._line_to_address_cache:
-                        self._line_to_address_cache[key] = state.address
-
-                    prev_state = state
-            except Exception:
-                # Skip line programs with corrupted data
-                continue
+                        file_paths_cache[file_index] = sys.intern(full_path)
+                    else:
+                        # Fallback to Watcom format: use CU name
+                        if cu_name_str is None:
+                            cu_name_str = self._get_unit_string(CU, 'DW_AT_name')
+                        file_paths_cache[file_index] = sys.intern(cu_name_str) if cu_name_str else "unknown"
+
+                    self._register_file(file_paths_cache[file_index])
+
+                file_path = file_paths_cache[file_index]
+
+                # Add to caches
+                rows[state.address] = self._register_row(self._file_ids[file_path], state.line, state.column)
 
+                # For line-to-address, use the first address for each line
+                key = (file_path, state.line)
+                if key not in self._line_to_address_cache:
+                    self._line_to_address_cache[key] = state.address
+
+                    # Secondary indexes for basename / case-insensitive lookups
+                    basename = _basename(file_path)
+                    self._by_basename.setdefault(basename, {}).setdefault(state.line, state.address)
+                    self._by_basename_lower.setdefault(basename.lower(), {}).setdefault(state.line, state.address)
+
+                prev_state = state
+        except Exception:
+            # Skip line programs with corrupted data
+            return
+
+    def _get_unit_string(self, CU, attr_name: str) -> str:
+        """Read a string attribute from a compilation unit's top DIE.
+
+        Returns:
+            The decoded string, or '' if the attribute is missing or unreadable
+        """
+        try:
+            attr = CU.get_top_DIE().attributes.get(attr_name)
+            return attr.value.decode('utf-8', errors='ignore') if attr else ''
+        except Exception:
+            return ''
+
+    def _register_file(self, file_path: str) -> int:
+        """Get the file ID for a path, assigning a new one if needed."""
+        file_id = self._file_ids.get(file_path)
+        if file_id is None:
+            file_id = len(self._files)
+            self._files.append(file_path)
+            self._file_ids[file_path] = file_id
+        return file_id
+
+    def _register_row(self, file_id: int, line: int, column: int) -> int:
+        """Get the row ID for a (file, line, column) triple, assigning a new one if needed."""
+        key = (file_id, line, column)
+        row_id = self._row_index.get(key)
+        if row_id is None:
+            row_id = len(self._rows)
+            self._rows.append(key)
+            self._row_index[key] = row_id
+        return row_id
+
+    def _location_at(self, table: tuple, index: int) -> SourceLocation:
+        """Build a SourceLocation for an entry of a line table snapshot."""
+        addresses, row_ids = table
+        file_id, line, column = self._rows[row_ids[index]]
+        return SourceLocation(
+            file=self._files[file_id],
+            line=line,
+            column=column,
+            address=addresses[index]
+        )
 
     def address_to_line(self, address: int) -> Optional[SourceLocation]:
         """Convert an address to a source location.
@@ -139,22 +307,18 @@ class LineInfo:
         Returns:
             SourceLocation if found, None otherwise
         """
-        # Exact match
-        if address in self._address_to_line_cache:
-            return self._address_to_line_cache[address]
-
-        # Find closest address before this one
-        closest_addr = None
-        for addr in sorted(self._address_to_line_cache.keys()):
-            if addr <= address:
-                closest_addr = addr
-            else:
-                break
+        self._load_units_for_address(address)
+        return self._address_lookup(address)
 
-        if closest_addr is not None:
-            return self._address_to_line_cache[closest_addr]
+    def _find_address(self, address: int) -> Optional[SourceLocation]:
+        """Uncached address lookup backing address_to_line()."""
+        # Find the closest row at or before this address (exact match included)
+        table = self._table
+        index = bisect_right(table[0], address)
+        if index == 0:
+            return None
 
-        return None
+        return self._location_at(table, index - 1)
 
     def line_to_address(self, file: str, line: int) -> Optional[int]:
         """Convert a source location to an address.
@@ -166,24 +330,32 @@ class LineInfo:
         Returns:
             Address if found, None otherwise
         """
+        # Decode the units named after this file first, then everything else on a miss
+        self._load_units_for_file(file)
+        addr = self._find_line(file, line)
+        if addr is None and self._pending_units:
+            self._load_all_units()
+            addr = self._find_line(file, line)
+        return addr
+
+    def _find_line(self, file: str, line: int) -> Optional[int]:
+        """Look up a source line in the units loaded so far."""
         # Try exact match first
         key = (file, line)
         if key in self._line_to_address_cache:
             return self._line_to_address_cache[key]
 
         # Try basename match (in case user provides just the filename)
-        file_basename = Path(file).name
-        for (cached_file, cached_line), addr in self._line_to_address_cache.items():
-            if Path(cached_file).name == file_basename and cached_line == line:
-                return addr
-
-        # Try case-insensitive match (Windows paths)
-        file_lower = file.lower()
-        file_basename_lower = file_basename.lower()
-        for (cached_file, cached_line), addr in self._line_to_address_cache.items():
-            if (cached_file.lower() == file_lower or
-                Path(cached_file).name.lower() == file_basename_lower) and cached_line == line:
-                return addr
+        file_basename = _basename(file)
+        addr = self._by_basename.get(file_basename, {}).get(line)
+        if addr is not None:
+            return addr
+
+        # Try case-insensitive match (Windows paths). A case-insensitive full path
+        # match implies a basename match, so the basename index covers both.
+        addr = self._by_basename_lower.get(file_basename.lower(), {}).get(line)
+        if addr is not None:
+            return addr
 
         return None
 
@@ -193,12 +365,15 @@ class LineInfo:
         Yields:
             SourceLocation objects
         """
+        self._load_all_units()
+        table = self._table
+        rows = self._rows
         seen = set()
-        for loc in self._address_to_line_cache.values():
-            key = (loc.file, loc.line)
+        for index, row_id in enumerate(table[1]):
+            key = rows[row_id][:2]  # (file_id, line)
             if key not in seen:
                 seen.add(key)
-                yield loc
+                yield self._location_at(table, index)
 
     def get_files(self):
         """Get all source files referenced in debug info.
@@ -206,7 +381,15 @@ class LineInfo:
         Returns:
             Set of file paths
         """
-        files = set()
-        for loc in self._address_to_line_cache.values():
-            files.add(loc.file)
-        return files
+        self._load_all_units()
+        return {self._files[self._rows[row_id][0]] for row_id in set(self._table[1])}
+
+    def get_unit_names(self):
+        """Get the names of all compilation units.
+
+        Unlike get_files(), this doesn't decode any line programs.
+
+        Returns:
+            List of compilation unit names (DW_AT_name)
+        """
+        return list(self._unit_names)
@@ -46,6 +46,13 @@ DW_OP_breg31 = 0x8f
 # Frame base relative
 DW_OP_fbreg = 0x91
 
+# Precompiled little-endian operand decoders
+_S8 = struct.Struct('<b')
+_U16 = struct.Struct('<H')
+_S16 = struct.Struct('<h')
+_U32 = struct.Struct('<I')
+_S32 = struct.Struct('<i')
+
 # x86-32 register mapping (standard DWARF x86 register numbering)
 X86_REGISTER_MAP = {
     0: 'eax',
@@ -65,6 +72,26 @@ class LocationEvaluationError(Exception):
     pass
 
 
+class _RegisterSnapshot:
+    """Process controller view that reads a thread's registers only once.
+
+    Used for batch evaluation while the thread is suspended at a debug event,
+    where register values can't change between reads.
+    """
+
+    def __init__(self, process_controller: 'ProcessController', registers: Optional[dict] = None):
+        self._process_controller = process_controller
+        self._registers = registers
+
+    def get_register(self, thread_id: int, register_name: str) -> int:
+        if self._registers is None:
+            self._registers = self._process_controller.get_all_registers(thread_id)
+        return self._registers[register_name.lower()]
+
+    def read_memory(self, address: int, size: int) -> bytes:
+        return self._process_controller.read_memory(address, size)
+
+
 class LocationEvaluator:
     """Evaluates DWARF location expressions.
 
@@ -73,6 +100,8 @@ class LocationEvaluator:
 
     def __init__(self, process_controller: 'ProcessController'):
         self.process_controller = process_controller
+        # Location expression -> compiled steps (see _compile)
+        self._compiled_cache: dict[bytes, tuple] = {}
 
     def evaluate_location(
         self,
@@ -98,173 +127,232 @@ class LocationEvaluator:
         if not expr:
             raise LocationEvaluationError("Empty location expression")
 
+        # pyelftools hands out expressions as lists of ints; operand decoding needs a buffer.
+        # Anything else (an int offset into .debug_loc) is a location list.
+        if not isinstance(expr, bytes):
+            if not isinstance(expr, (list, tuple)):
+                raise LocationEvaluationError("Location lists not supported")
+            expr = bytes(expr)
+
+        # Fast paths for single-operation expressions, which is nearly every
+        # Watcom location: DW_OP_fbreg for locals, DW_OP_addr for globals and
+        # DW_OP_regN for register variables. Anything else goes through compiled steps.
+        end = len(expr)
+        op0 = expr[0]
+        if op0 == DW_OP_fbreg:
+            if frame_base is not None:
+                sleb_offset, bytes_read = self._decode_sleb128(expr, 1)
+                if 1 + bytes_read == end:
+                    return frame_base + sleb_offset
+        elif op0 == DW_OP_addr:
+            if end == 5:
+                return _U32.unpack_from(expr, 1)[0] + module_base
+        elif DW_OP_reg0 <= op0 <= DW_OP_reg31:
+            return self._read_register(thread_id, op0 - DW_OP_reg0)
+
+        # General case: run the expression's compiled steps, compiling it on first use
+        steps = self._compiled_cache.get(expr)
+        if steps is None:
+            steps = self._compile(expr)
+            self._compiled_cache[expr] = steps
+
         stack = []
+        for step, operand in steps:
+            step(self, stack, operand, thread_id, frame_base, module_base)
+
+        # Result is top of stack
+        if not stack:
+            raise LocationEvaluationError("Expression evaluation left empty stack")
+
+        return stack[-1]
+
+    def _compile(self, expr: bytes) -> tuple:
+        """Compile a location expression into a sequence of steps.
+
+        Operands are decoded once here, so evaluating the expression again only
+        runs the steps. Errors found while decoding become a failing step at the
+        same position, so they surface exactly where the opcode-by-opcode
+        interpretation would have raised them.
+
+        Args:
+            expr: Location expression bytes
+
+        Returns:
+            Tuple of (step, operand) pairs, where step is called as
+            step(evaluator, stack, operand, thread_id, frame_base, module_base)
+        """
+        steps = []
         offset = 0
+        end = len(expr)
+        parsers = _PARSERS
 
-        while offset < len(expr):
-            opcode = expr[offset]
-            offset += 1
+        opcode = 0
+        try:
+            while offset < end:
+                opcode = expr[offset]
+                offset += 1
 
-            try:
                 # Register operations (value is in register)
+                # For DW_OP_reg*, the value IS the variable (not an address) - evaluation ends here
                 if DW_OP_reg0 <= opcode <= DW_OP_reg31:
-                    reg_num = opcode - DW_OP_reg0
-                    reg_name = X86_REGISTER_MAP.get(reg_num)
-                    if not reg_name:
-                        raise LocationEvaluationError(f"Unknown register number: {reg_num}")
-                    value = self.process_controller.get_register(thread_id, reg_name)
-                    # For DW_OP_reg*, the value IS the variable (not an address)
-                    # We return it directly
-                    return value
-
-                # Register + offset operations (address is register + offset)
-                elif DW_OP_breg0 <= opcode <= DW_OP_breg31:
-                    reg_num = opcode - DW_OP_breg0
-                    reg_name = X86_REGISTER_MAP.get(reg_num)
-                    if not reg_name:
-                        raise LocationEvaluationError(f"Unknown register number: {reg_num}")
-
-                    # Read SLEB128 offset
-                    sleb_offset, bytes_read = self._decode_sleb128(expr[offset:])
-                    offset += bytes_read
-
-                    reg_value = self.process_controller.get_register(thread_id, reg_name)
-                    address = reg_value + sleb_offset
-                    stack.append(address)
-
-                # Frame base relative
-                elif opcode == DW_OP_fbreg:
-                    if frame_base is None:
-                        raise LocationEvaluationError("Frame base required for DW_OP_fbreg")
-
-                    # Read SLEB128 offset
-                    sleb_offset, bytes_read = self._decode_sleb128(expr[offset:])
-                    offset += bytes_read
-
-                    address = frame_base + sleb_offset
-                    stack.append(address)
-
-                # Absolute address
-                elif opcode == DW_OP_addr:
-                    # Read 4-byte address (32-bit)
-                    if offset + 4 > len(expr):
-                        raise LocationEvaluationError("Truncated DW_OP_addr operand")
-                    addr_bytes = expr[offset:offset + 4]
-                    address = struct.unpack('<I', addr_bytes)[0]
-                    offset += 4
-
-                    # Relocate with module base
-                    address += module_base
-                    stack.append(address)
-
-                # Constants
-                elif opcode == DW_OP_const1u:
-                    value = expr[offset]
-                    offset += 1
-                    stack.append(value)
-
-                elif opcode == DW_OP_const1s:
-                    value = struct.unpack('<b', expr[offset:offset + 1])[0]
-                    offset += 1
-                    stack.append(value)
-
-                elif opcode == DW_OP_const2u:
-                    value = struct.unpack('<H', expr[offset:offset + 2])[0]
-                    offset += 2
-                    stack.append(value)
-
-                elif opcode == DW_OP_const2s:
-                    value = struct.unpack('<h', expr[offset:offset + 2])[0]
-                    offset += 2
-                    stack.append(value)
-
-                elif opcode == DW_OP_const4u:
-                    value = struct.unpack('<I', expr[offset:offset + 4])[0]
-                    offset += 4
-                    stack.append(value)
-
-                elif opcode == DW_OP_const4s:
-                    value = struct.unpack('<i', expr[offset:offset + 4])[0]
-                    offset += 4
-                    stack.append(value)
-
-                elif opcode == DW_OP_constu:
-                    value, bytes_read = self._decode_uleb128(expr[offset:])
-                    offset += bytes_read
-                    stack.append(value)
-
-                elif opcode == DW_OP_consts:
-                    value, bytes_read = self._decode_sleb128(expr[offset:])
-                    offset += bytes_read
-                    stack.append(value)
-
-                # Stack operations
-                elif opcode == DW_OP_dup:
-                    if not stack:
-                        raise LocationEvaluationError("DW_OP_dup on empty stack")
-                    stack.append(stack[-1])
-
-                elif opcode == DW_OP_drop:
-                    if not stack:
-                        raise LocationEvaluationError("DW_OP_drop on empty stack")
-                    stack.pop()
-
-                elif opcode == DW_OP_over:
-                    if len(stack) < 2:
-                        raise LocationEvaluationError("DW_OP_over requires 2 stack items")
-                    stack.append(stack[-2])
-
-                elif opcode == DW_OP_swap:
-                    if len(stack) < 2:
-                        raise LocationEvaluationError("DW_OP_swap requires 2 stack items")
-                    stack[-1], stack[-2] = stack[-2], stack[-1]
-
-                # Arithmetic operations
-                elif opcode == DW_OP_plus:
-                    if len(stack) < 2:
-                        raise LocationEvaluationError("DW_OP_plus requires 2 stack items")
-                    b = stack.pop()
-                    a = stack.pop()
-                    stack.append(a + b)
-
-                elif opcode == DW_OP_minus:
-                    if len(stack) < 2:
-                        raise LocationEvaluationError("DW_OP_minus requires 2 stack items")
-                    b = stack.pop()
-                    a = stack.pop()
-                    stack.append(a - b)
-
-                elif opcode == DW_OP_plus_uconst:
-                    if not stack:
-                        raise LocationEvaluationError("DW_OP_plus_uconst requires 1 stack item")
-                    value, bytes_read = self._decode_uleb128(expr[offset:])
-                    offset += bytes_read
-                    stack[-1] += value
-
-                # Dereference
-                elif opcode == DW_OP_deref:
-                    if not stack:
-                        raise LocationEvaluationError("DW_OP_deref on empty stack")
-                    address = stack.pop()
-                    # Read 4 bytes from memory (32-bit pointer)
-                    try:
-                        data = self.process_controller.read_memory(address, 4)
-                        value = struct.unpack('<I', data)[0]
-                        stack.append(value)
-                    except Exception as e:
-                        raise LocationEvaluationError(f"Failed to dereference 0x{address:x}: {e}")
-
-                else:
-                    raise LocationEvaluationError(f"Unsupported opcode: 0x{opcode:02x}")
-
-            except (struct.error, IndexError) as e:
-                raise LocationEvaluationError(f"Error parsing opcode 0x{opcode:02x}: {e}")
+                    steps.append((LocationEvaluator._step_reg, opcode - DW_OP_reg0))
+                    break
 
-        # Result is top of stack
+                parser = parsers[opcode]
+                if parser is None:
+                    steps.append((LocationEvaluator._step_fail, f"Unsupported opcode: 0x{opcode:02x}"))
+                    break
+
+                step, operand, offset = parser(self, expr, offset, opcode)
+                steps.append((step, operand))
+                if step is LocationEvaluator._step_fail:
+                    break
+        except (struct.error, IndexError) as e:
+            steps.append((LocationEvaluator._step_fail, f"Error parsing opcode 0x{opcode:02x}: {e}"))
+
+        return tuple(steps)
+
+    def _read_register(self, thread_id: int, reg_num: int) -> int:
+        """Read a register by its DWARF register number."""
+        reg_name = X86_REGISTER_MAP.get(reg_num)
+        if not reg_name:
+            raise LocationEvaluationError(f"Unknown register number: {reg_num}")
+        return self.process_controller.get_register(thread_id, reg_name)
+
+    # Opcode parsers
+    #
+    # Each parser takes (expr, offset, opcode), where offset points just past the
+    # opcode byte, decodes the operands and returns (step, operand, next offset).
+
+    def _parse_breg(self, expr, offset, opcode):
+        """DW_OP_breg*: address is register + SLEB128 offset."""
+        reg_num = opcode - DW_OP_breg0
+        if reg_num not in X86_REGISTER_MAP:
+            return LocationEvaluator._step_fail, f"Unknown register number: {reg_num}", offset
+
+        sleb_offset, bytes_read = self._decode_sleb128(expr, offset)
+        return LocationEvaluator._step_breg, (reg_num, sleb_offset), offset + bytes_read
+
+    def _parse_fbreg(self, expr, offset, opcode):
+        """DW_OP_fbreg: address is frame base + SLEB128 offset."""
+        sleb_offset, bytes_read = self._decode_sleb128(expr, offset)
+        return LocationEvaluator._step_fbreg, sleb_offset, offset + bytes_read
+
+    def _parse_addr(self, expr, offset, opcode):
+        """DW_OP_addr: absolute 4-byte address, relocated by the module base."""
+        if offset + 4 > len(expr):
+            return LocationEvaluator._step_fail, "Truncated DW_OP_addr operand", offset
+        return LocationEvaluator._step_addr, _U32.unpack_from(expr, offset)[0], offset + 4
+
+    def _parse_const1u(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, expr[offset], offset + 1
+
+    def _parse_const1s(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, _S8.unpack_from(expr, offset)[0], offset + 1
+
+    def _parse_const2u(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, _U16.unpack_from(expr, offset)[0], offset + 2
+
+    def _parse_const2s(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, _S16.unpack_from(expr, offset)[0], offset + 2
+
+    def _parse_const4u(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, _U32.unpack_from(expr, offset)[0], offset + 4
+
+    def _parse_const4s(self, expr, offset, opcode):
+        return LocationEvaluator._step_push, _S32.unpack_from(expr, offset)[0], offset + 4
+
+    def _parse_constu(self, expr, offset, opcode):
+        value, bytes_read = self._decode_uleb128(expr, offset)
+        return LocationEvaluator._step_push, value, offset + bytes_read
+
+    def _parse_consts(self, expr, offset, opcode):
+        value, bytes_read = self._decode_sleb128(expr, offset)
+        return LocationEvaluator._step_push, value, offset + bytes_read
+
+    def _parse_plus_uconst(self, expr, offset, opcode):
+        value, bytes_read = self._decode_uleb128(expr, offset)
+        return LocationEvaluator._step_plus_uconst, value, offset + bytes_read
+
+    def _parse_stack_op(self, expr, offset, opcode):
+        """Operations without operands that only work on the stack."""
+        return _STACK_STEPS[opcode], None, offset
+
+    # Steps
+    #
+    # Each step takes (stack, operand, thread_id, frame_base, module_base) and
+    # updates the stack in place.
+
+    def _step_fail(self, stack, message, thread_id, frame_base, module_base):
+        raise LocationEvaluationError(message)
+
+    def _step_reg(self, stack, reg_num, thread_id, frame_base, module_base):
+        stack.append(self._read_register(thread_id, reg_num))
+
+    def _step_breg(self, stack, operand, thread_id, frame_base, module_base):
+        reg_num, sleb_offset = operand
+        stack.append(self._read_register(thread_id, reg_num) + sleb_offset)
+
+    def _step_fbreg(self, stack, sleb_offset, thread_id, frame_base, module_base):
+        if frame_base is None:
+            raise LocationEvaluationError("Frame base required for DW_OP_fbreg")
+        stack.append(frame_base + sleb_offset)
+
+    def _step_addr(self, stack, address, thread_id, frame_base, module_base):
+        stack.append(address + module_base)
+
+    def _step_push(self, stack, value, thread_id, frame_base, module_base):
+        stack.append(value)
+
+    def _step_dup(self, stack, operand, thread_id, frame_base, module_base):
         if not stack:
-            raise LocationEvaluationError("Expression evaluation left empty stack")
+            raise LocationEvaluationError("DW_OP_dup on empty stack")
+        stack.append(stack[-1])
 
-        return stack[-1]
+    def _step_drop(self, stack, operand, thread_id, frame_base, module_base):
+        if not stack:
+            raise LocationEvaluationError("DW_OP_drop on empty stack")
+        stack.pop()
+
+    def _step_over(self, stack, operand, thread_id, frame_base, module_base):
+        if len(stack) < 2:
+            raise LocationEvaluationError("DW_OP_over requires 2 stack items")
+        stack.append(stack[-2])
+
+    def _step_swap(self, stack, operand, thread_id, frame_base, module_base):
+        if len(stack) < 2:
+            raise LocationEvaluationError("DW_OP_swap requires 2 stack items")
+        stack[-1], stack[-2] = stack[-2], stack[-1]
+
+    def _step_plus(self, stack, operand, thread_id, frame_base, module_base):
+        if len(stack) < 2:
+            raise LocationEvaluationError("DW_OP_plus requires 2 stack items")
+        b = stack.pop()
+        a = stack.pop()
+        stack.append(a + b)
+
+    def _step_minus(self, stack, operand, thread_id, frame_base, module_base):
+        if len(stack) < 2:
+            raise LocationEvaluationError("DW_OP_minus requires 2 stack items")
+        b = stack.pop()
+        a = stack.pop()
+        stack.append(a - b)
+
+    def _step_plus_uconst(self, stack, value, thread_id, frame_base, module_base):
+        if not stack:
+            raise LocationEvaluationError("DW_OP_plus_uconst requires 1 stack item")
+        stack[-1] += value
+
+    def _step_deref(self, stack, operand, thread_id, frame_base, module_base):
+        """DW_OP_deref: replace the address on top of the stack with the 32-bit value it points to."""
+        if not stack:
+            raise LocationEvaluationError("DW_OP_deref on empty stack")
+        address = stack.pop()
+        try:
+            data = self.process_controller.read_memory(address, 4)
+            stack.append(_U32.unpack_from(data)[0])
+        except Exception as e:
+            raise LocationEvaluationError(f"Failed to dereference 0x{address:x}: {e}")
 
     def evaluate_frame_base(
         self,
@@ -287,22 +375,97 @@ class LocationEvaluator:
         Raises:
             LocationEvaluationError: If expression cannot be evaluated
         """
+        # Watcom frame bases are a lone DW_OP_regN (EBP) - read the register directly
+        if isinstance(frame_base_expr, (bytes, list, tuple)) and len(frame_base_expr) == 1:
+            opcode = frame_base_expr[0]
+            if DW_OP_reg0 <= opcode <= DW_OP_reg31:
+                return self._read_register(thread_id, opcode - DW_OP_reg0)
+
         return self.evaluate_location(frame_base_expr, thread_id, frame_base=None, module_base=module_base)
 
-    def _decode_uleb128(self, data: bytes) -> tuple[int, int]:
+    def evaluate_locations_batch(
+        self,
+        exprs: list[Optional[bytes]],
+        thread_id: int,
+        frame_base_expr: Optional[bytes] = None,
+        module_base: int = 0,
+        frame_base: Optional[int] = None,
+        registers: Optional[dict] = None
+    ) -> tuple[Optional[int], list]:
+        """Evaluate a frame base and several location expressions for one stop.
+
+        Everything is evaluated against a single register snapshot, so the
+        thread context is fetched once instead of once per register read.
+
+        Args:
+            exprs: Location expressions to evaluate (None entries are skipped)
+            thread_id: Thread ID for register access
+            frame_base_expr: Frame base expression of the enclosing subprogram.
+                EBP is used if it is missing or can't be evaluated.
+            module_base: Module base address for relocating addresses
+            frame_base: Frame base already computed for this stop, if known.
+                frame_base_expr isn't evaluated when it's given.
+            registers: The thread's registers at this stop, as returned by
+                get_all_registers(), if already read. Otherwise they're read
+                the first time an expression needs one.
+
+        Returns:
+            Tuple of (frame_base, results). results[i] is the computed address
+            for exprs[i], the exception raised while evaluating it, or None if
+            exprs[i] was None.
+        """
+        evaluator = LocationEvaluator(_RegisterSnapshot(self.process_controller, registers))
+        # Compiled expressions don't depend on the register source, so share them
+        evaluator._compiled_cache = self._compiled_cache
+
+        if frame_base is None and frame_base_expr:
+            try:
+                frame_base = evaluator.evaluate_frame_base(frame_base_expr, thread_id, module_base)
+            except LocationEvaluationError:
+                pass
+        if frame_base is None:
+            # No usable frame base expression - fall back to EBP
+            try:
+                frame_base = evaluator.process_controller.get_register(thread_id, 'ebp')
+            except Exception:
+                frame_base = None
+
+        results = []
+        for expr in exprs:
+            if expr is None:
+                results.append(None)
+                continue
+            try:
+                results.append(evaluator.evaluate_location(expr, thread_id, frame_base, module_base))
+            except Exception as e:
+                results.append(e)
+
+        return frame_base, results
+
+    def _decode_uleb128(self, data: bytes, start: int = 0) -> tuple[int, int]:
         """Decode an unsigned LEB128 value.
 
         Args:
             data: Bytes to decode from
+            start: Offset of the first LEB128 byte in data
 
         Returns:
             Tuple of (decoded value, number of bytes consumed)
         """
+        # Fast paths: almost every operand in a location expression fits in 1-2 bytes
+        end = len(data)
+        if start < end:
+            byte = data[start]
+            if byte < 0x80:
+                return byte, 1
+            if start + 1 < end and data[start + 1] < 0x80:
+                return (byte & 0x7f) | (data[start + 1] << 7), 2
+
         result = 0
         shift = 0
-        offset = 0
+        offset = start
 
-        while offset < len(data):
+        while offset < end:
             byte = data[offset]
             offset += 1
             result |= (byte & 0x7f) << shift
@@ -310,23 +473,36 @@ class LocationEvaluator:
             if (byte & 0x80) == 0:
                 break
 
-        return result, offset
+        return result, offset - start
 
-    def _decode_sleb128(self, data: bytes) -> tuple[int, int]:
+    def _decode_sleb128(self, data: bytes, start: int = 0) -> tuple[int, int]:
         """Decode a signed LEB128 value.
 
         Args:
             data: Bytes to decode from
+            start: Offset of the first LEB128 byte in data
 
         Returns:
             Tuple of (decoded value, number of bytes consumed)
         """
+        # Fast paths: frame offsets of locals almost always fit in 1-2 bytes
+        end = len(data)
+        if start < end:
+            byte = data[start]
+            if byte < 0x80:
+                return (byte - 0x80 if byte & 0x40 else byte), 1
+            if start + 1 < end:
+                high = data[start + 1]
+                if high < 0x80:
+                    value = (byte & 0x7f) | (high << 7)
+                    return (value - 0x4000 if high & 0x40 else value), 2
+
         result = 0
         shift = 0
-        offset = 0
+        offset = start
         byte = 0
 
-        while offset < len(data):
+        while offset < end:
             byte = data[offset]
             offset += 1
             result |= (byte & 0x7f) << shift
@@ -338,4 +514,35 @@ class LocationEvaluator:
         if shift < 64 and (byte & 0x40):
             result |= -(1 << shift)
 
-        return result, offset
+        return result, offset - start
+
+
+# Opcode -> parser table (None for unsupported opcodes).
+# DW_OP_reg* is handled inline by _compile since it ends evaluation.
+_PARSERS = [None] * 256
+for _opcode in range(DW_OP_breg0, DW_OP_breg31 + 1):
+    _PARSERS[_opcode] = LocationEvaluator._parse_breg
+_PARSERS[DW_OP_fbreg] = LocationEvaluator._parse_fbreg
+_PARSERS[DW_OP_addr] = LocationEvaluator._parse_addr
+_PARSERS[DW_OP_const1u] = LocationEvaluator._parse_const1u
+_PARSERS[DW_OP_const1s] = LocationEvaluator._parse_const1s
+_PARSERS[DW_OP_const2u] = LocationEvaluator._parse_const2u
+_PARSERS[DW_OP_const2s] = LocationEvaluator._parse_const2s
+_PARSERS[DW_OP_const4u] = LocationEvaluator._parse_const4u
+_PARSERS[DW_OP_const4s] = LocationEvaluator._parse_const4s
+_PARSERS[DW_OP_constu] = LocationEvaluator._parse_constu
+_PARSERS[DW_OP_consts] = LocationEvaluator._parse_consts
+_PARSERS[DW_OP_plus_uconst] = LocationEvaluator._parse_plus_uconst
+
+# Operand-less stack operations
+_STACK_STEPS = {
+    DW_OP_dup: LocationEvaluator._step_dup,
+    DW_OP_drop: LocationEvaluator._step_drop,
+    DW_OP_over: LocationEvaluator._step_over,
+    DW_OP_swap: LocationEvaluator._step_swap,
+    DW_OP_plus: LocationEvaluator._step_plus,
+    DW_OP_minus: LocationEvaluator._step_minus,
+    DW_OP_deref: LocationEvaluator._step_deref,
+}
+for _opcode in _STACK_STEPS:
+    _PARSERS[_opcode] = LocationEvaluator._parse_stack_op
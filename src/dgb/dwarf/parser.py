@@ -6,6 +6,8 @@ rather than using standard PE debug sections. This parser handles both formats.
 """
 
 import io
+import mmap
+import os
 import struct
 from pathlib import Path
 from typing import Optional
@@ -15,6 +17,14 @@ from elftools.elf.elffile import ELFFile
 from elftools.dwarf.dwarfinfo import DWARFInfo
 
 
+# Files smaller than this are scanned with a plain read of the bytes after the
+# PE image; larger ones are memory-mapped
+_MMAP_MIN_SIZE = 16 * 1024 * 1024
+
+# Bytes read to parse the DOS/PE headers and section table of small files
+_PE_HEADERS_SIZE = 4096
+
+
 class WatcomDwarfParser:
     """Parser for DWARF debug information in Windows PE files.
 
@@ -38,19 +48,21 @@ class WatcomDwarfParser:
         if not self.pe_path.exists():
             raise FileNotFoundError(f"PE file not found: {self.pe_path}")
 
-        # Try standard PE sections first
-        self.pe = pefile.PE(str(self.pe_path))
-        dwarf_info = self._try_pe_sections()
+        # Try Watcom appended ELF container first - it only needs the PE section
+        # table, which is read directly instead of building a full pefile.PE
+        dwarf_info = self._try_watcom_elf()
         if dwarf_info:
             self.dwarf_info = dwarf_info
-            self.format_type = 'pe_sections'
+            self.format_type = 'watcom_elf'
             return dwarf_info
 
-        # Try Watcom appended ELF container
-        dwarf_info = self._try_watcom_elf()
+        # Try standard PE sections. Only the headers and section table are
+        # needed, so skip parsing the data directories (imports, resources, ...)
+        self.pe = pefile.PE(str(self.pe_path), fast_load=True)
+        dwarf_info = self._try_pe_sections()
         if dwarf_info:
             self.dwarf_info = dwarf_info
-            self.format_type = 'watcom_elf'
+            self.format_type = 'pe_sections'
             return dwarf_info
 
         return None
@@ -85,24 +97,32 @@ class WatcomDwarfParser:
         """Try to extract DWARF from Watcom appended ELF container.
 
         Watcom compilers append an ELF file with DWARF sections to the end of the PE file.
-        We scan for the ELF magic bytes (0x7F 'E' 'L' 'F') and extract the ELF data.
+        We scan for the ELF magic bytes (0x7F 'E' 'L' 'F') after the last PE section's
+        raw data and extract the ELF data.
 
         Returns:
             DWARFInfo object if ELF container found, None otherwise
         """
         with open(self.pe_path, 'rb') as f:
-            data = f.read()
-
-        # Look for ELF magic bytes: 0x7F 'E' 'L' 'F'
-        elf_magic = b'\x7fELF'
-        elf_offset = data.find(elf_magic)
-
-        if elf_offset == -1:
+            file_size = os.fstat(f.fileno()).st_size
+
+            if file_size < _MMAP_MIN_SIZE:
+                # Small file: read the headers, then just the bytes after the image
+                # with a plain seek+read - cheaper than setting up a mapping
+                image_end = self._get_image_end(f.read(_PE_HEADERS_SIZE))
+                f.seek(image_end)
+                elf_data = self._extract_elf(f.read(), 0)
+            else:
+                # Large file: map it instead of reading it. Only the pages the magic
+                # scan touches and the ELF tail itself are brought in, and mmap.find()
+                # uses the C library's memory search. The mapping is closed afterwards
+                # so the executable isn't held open while it's debugged.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    elf_data = self._extract_elf(mm, self._get_image_end(mm))
+
+        if elf_data is None:
             return None
 
-        # Extract ELF data from the offset to end of file
-        elf_data = data[elf_offset:]
-
         # Validate it's a proper ELF file
         if len(elf_data) < 52:  # Minimum ELF header size
             return None
@@ -123,6 +143,105 @@ class WatcomDwarfParser:
             # Not a valid ELF file or no DWARF info
             return None
 
+    def _extract_elf(self, data, start: int) -> Optional[bytes]:
+        """Find the appended ELF container in a buffer and copy it out.
+
+        Args:
+            data: Buffer holding the file contents (or the part after the PE image)
+            start: Offset in data to start searching from
+
+        Returns:
+            Bytes of the ELF container, or None if there is none
+        """
+        # Look for ELF magic bytes: 0x7F 'E' 'L' 'F'. The container is appended
+        # after the image, so section data (which may contain the same bytes)
+        # is skipped by the caller's start offset.
+        elf_magic = b'\x7fELF'
+        elf_offset = data.find(elf_magic, start)
+
+        if elf_offset == -1:
+            return None
+
+        # Copy only the ELF container itself, as far as its headers declare
+        # (anything after it isn't read by pyelftools)
+        elf_size = self._get_elf_size(data, elf_offset)
+        if elf_size is None:
+            return None
+        return data[elf_offset:elf_offset + elf_size]
+
+    def _get_elf_size(self, data, offset: int) -> Optional[int]:
+        """Get the size of an ELF file from its headers.
+
+        The size is the furthest extent of the ELF header, program header table,
+        section header table and section contents.
+
+        Args:
+            data: Buffer holding the ELF file
+            offset: Offset of the ELF header in data
+
+        Returns:
+            Size in bytes, or None if the headers aren't valid
+        """
+        try:
+            elf_class = data[offset + 4]  # EI_CLASS
+            elf_encoding = data[offset + 5]  # EI_DATA
+            endian = {1: '<', 2: '>'}.get(elf_encoding)
+            if endian is None:
+                return None
+
+            if elf_class == 1:  # ELFCLASS32
+                header_format, section_format, section_fields = 'HHIIIIIHHHHHH', 'II', 16
+            elif elf_class == 2:  # ELFCLASS64
+                header_format, section_format, section_fields = 'HHIQQQIHHHHHH', 'QQ', 24
+            else:
+                return None
+
+            (_, _, _, _, e_phoff, e_shoff, _, e_ehsize, e_phentsize, e_phnum,
+             e_shentsize, e_shnum, _) = struct.unpack_from(endian + header_format, data, offset + 16)
+
+            size = max(e_ehsize, e_phoff + e_phentsize * e_phnum, e_shoff + e_shentsize * e_shnum)
+            for i in range(e_shnum):
+                section = offset + e_shoff + i * e_shentsize
+                sh_type = struct.unpack_from(endian + 'I', data, section + 4)[0]
+                if sh_type == 8:  # SHT_NOBITS occupies no file space
+                    continue
+                sh_offset, sh_size = struct.unpack_from(endian + section_format, data, section + section_fields)
+                size = max(size, sh_offset + sh_size)
+            return size
+        except (struct.error, IndexError):
+            return None
+
+    def _get_image_end(self, data) -> int:
+        """Get the file offset just past the last PE section's raw data.
+
+        Reads the DOS/PE headers and section table directly, which is all that's
+        needed here and much cheaper than a pefile parse.
+
+        Args:
+            data: Buffer holding the file contents
+
+        Returns:
+            End of the PE image in the file, or 0 if the headers can't be read
+        """
+        try:
+            pe_offset = struct.unpack_from('<I', data, 0x3c)[0]  # e_lfanew
+            if data[pe_offset:pe_offset + 4] != b'PE\x00\x00':
+                return 0
+
+            # COFF file header follows the signature
+            num_sections = struct.unpack_from('<H', data, pe_offset + 6)[0]
+            optional_header_size = struct.unpack_from('<H', data, pe_offset + 20)[0]
+            section_table = pe_offset + 24 + optional_header_size
+
+            image_end = 0
+            for i in range(num_sections):
+                # SizeOfRawData and PointerToRawData of each 40-byte section header
+                size, pointer = struct.unpack_from('<II', data, section_table + i * 40 + 16)
+                image_end = max(image_end, pointer + size)
+            return image_end
+        except struct.error:
+            return 0
+
     def get_compilation_units(self):
         """Get all compilation units from DWARF info.
 
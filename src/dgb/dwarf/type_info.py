@@ -5,8 +5,8 @@ Represents types and provides value formatting based on type information.
 """
 
 import struct
-from dataclasses import dataclass
-from typing import Optional, List, Dict, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Callable, Optional, List, Dict, TYPE_CHECKING
 from elftools.dwarf.die import DIE
 
 if TYPE_CHECKING:
@@ -23,8 +23,64 @@ DW_ATE_signed_char = 0x06
 DW_ATE_unsigned = 0x07
 DW_ATE_unsigned_char = 0x08
 
-
-@dataclass
+# Precompiled little-endian decoders for scalar values
+_S8 = struct.Struct('<b')
+_U8 = struct.Struct('<B')
+_S16 = struct.Struct('<h')
+_U16 = struct.Struct('<H')
+_S32 = struct.Struct('<i')
+_U32 = struct.Struct('<I')
+_F32 = struct.Struct('<f')
+_S64 = struct.Struct('<q')
+_U64 = struct.Struct('<Q')
+_F64 = struct.Struct('<d')
+
+
+def _int_formatter(decoder: struct.Struct):
+    """Build a formatter that shows a decoded integer in decimal."""
+    def format_int(raw_bytes: bytes) -> str:
+        return str(decoder.unpack_from(raw_bytes)[0])
+    return format_int
+
+
+def _float_formatter(decoder: struct.Struct, precision: int):
+    """Build a formatter that shows a decoded float with the given significant digits."""
+    def format_float(raw_bytes: bytes) -> str:
+        return f"{decoder.unpack_from(raw_bytes)[0]:.{precision}g}"
+    return format_float
+
+
+# (byte_size, encoding) -> formatter for signed and floating point base types
+_BASE_FORMATTERS = {
+    (1, DW_ATE_signed): _int_formatter(_S8),
+    (1, DW_ATE_signed_char): _int_formatter(_S8),
+    (2, DW_ATE_signed): _int_formatter(_S16),
+    (4, DW_ATE_signed): _int_formatter(_S32),
+    (4, DW_ATE_float): _float_formatter(_F32, 6),
+    (8, DW_ATE_signed): _int_formatter(_S64),
+    (8, DW_ATE_float): _float_formatter(_F64, 15),
+}
+
+# byte_size -> formatter for every other encoding
+_UNSIGNED_FORMATTERS = {
+    1: _int_formatter(_U8),
+    2: _int_formatter(_U16),
+    4: _int_formatter(_U32),
+    8: _int_formatter(_U64),
+}
+
+# Pointer byte_size -> (decoder, hex format)
+_POINTER_FORMATS = {
+    4: (_U32, '08x'),
+    8: (_U64, '016x'),
+}
+
+# Placeholder cached while a type is being resolved, so a type that refers back
+# to itself (directly or through const) resolves to None instead of recursing
+_IN_PROGRESS = object()
+
+
+@dataclass(slots=True)
 class BaseType:
     """Represents a primitive base type."""
 
@@ -33,41 +89,54 @@ class BaseType:
     encoding: int  # DW_ATE_* encoding
 
 
-@dataclass
+@dataclass(slots=True)
 class PointerType:
     """Represents a pointer type."""
 
     pointee_offset: Optional[int]  # Type offset of what it points to
     byte_size: int = 4  # 32-bit pointers
+    # Decoder and hex format for the pointer size (None if the size isn't supported)
+    decoder: Optional[struct.Struct] = field(init=False, repr=False)
+    hex_format: Optional[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.decoder, self.hex_format = _POINTER_FORMATS.get(self.byte_size, (None, None))
 
 
-@dataclass
+@dataclass(slots=True)
 class StructMember:
     """Represents a member of a structure."""
 
     name: str
     type_offset: Optional[int]
     offset: int  # Byte offset within struct
+    name_prefix: str = field(init=False, repr=False)  # " name=" as shown by format_value
+
+    def __post_init__(self):
+        self.name_prefix = f" {self.name}="
 
 
-@dataclass
+@dataclass(slots=True)
 class StructType:
     """Represents a structure type."""
 
     name: Optional[str]
     byte_size: int
-    members: List[StructMember]
+    members: Optional[List[StructMember]] = None  # Parsed from die on first use
+    die: Optional[DIE] = field(default=None, repr=False)  # Structure DIE the members are parsed from
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayType:
     """Represents an array type."""
 
     element_type_offset: Optional[int]
     element_count: Optional[int]  # None for unbounded arrays
+    element_type: Optional[object] = None  # Resolved element type
+    element_size: Optional[int] = None  # None if the element type has no fixed size we format
 
 
-@dataclass
+@dataclass(slots=True)
 class TypedefType:
     """Represents a typedef."""
 
@@ -84,6 +153,8 @@ class TypeResolver:
     def __init__(self, die_parser: 'DIEParser'):
         self.die_parser = die_parser
         self._type_cache: Dict[int, object] = {}  # offset -> resolved type object
+        self._alias_cache: Dict[int, object] = {}  # offset -> type with typedefs unwrapped
+        self._name_cache: Dict[int, str] = {}  # offset -> type name
 
     def resolve_type(self, type_offset: int) -> Optional[object]:
         """Resolve a type by its DIE offset.
@@ -94,96 +165,88 @@ class TypeResolver:
         Returns:
             Type object (BaseType, PointerType, etc.) or None
         """
-        # Check cache
+        # Check cache (unresolvable types are cached as None too)
+        cached = self._type_cache.get(type_offset, _IN_PROGRESS)
+        if cached is not _IN_PROGRESS:
+            return cached
         if type_offset in self._type_cache:
-            return self._type_cache[type_offset]
+            # Reached again while it's being resolved - break the cycle
+            return None
 
         # Get DIE
         type_die = self.die_parser.get_type_die(type_offset)
         if not type_die:
+            self._type_cache[type_offset] = None
             return None
 
-        # Resolve based on tag
-        tag = type_die.tag
-        result = None
-
-        if tag == 'DW_TAG_base_type':
-            result = self._resolve_base_type(type_die)
-        elif tag == 'DW_TAG_pointer_type':
-            result = self._resolve_pointer_type(type_die)
-        elif tag == 'DW_TAG_structure_type':
-            result = self._resolve_struct_type(type_die)
-        elif tag == 'DW_TAG_typedef':
-            result = self._resolve_typedef(type_die)
-        elif tag == 'DW_TAG_const_type':
-            result = self._resolve_const_type(type_die)
-        elif tag == 'DW_TAG_array_type':
-            result = self._resolve_array_type(type_die)
-
-        # Cache result
-        if result:
-            self._type_cache[type_offset] = result
+        self._type_cache[type_offset] = _IN_PROGRESS
+
+        # Resolve based on tag. Malformed DIEs are handled here, once, rather
+        # than in every resolver.
+        resolver = _RESOLVERS.get(type_die.tag)
+        try:
+            result = resolver(self, type_die) if resolver else None
+        except Exception:
+            result = None
+
+        # Cache result (including None, so unsupported tags aren't looked up again)
+        self._type_cache[type_offset] = result
 
         return result
 
     def _resolve_base_type(self, die: DIE) -> Optional[BaseType]:
         """Resolve a base type DIE."""
-        try:
-            attrs = die.attributes
-
-            name_attr = attrs.get('DW_AT_name')
-            name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else 'unknown'
+        attrs = die.attributes
 
-            size_attr = attrs.get('DW_AT_byte_size')
-            byte_size = size_attr.value if size_attr else 0
+        name_attr = attrs.get('DW_AT_name')
+        name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else 'unknown'
 
-            encoding_attr = attrs.get('DW_AT_encoding')
-            encoding = encoding_attr.value if encoding_attr else DW_ATE_signed
+        size_attr = attrs.get('DW_AT_byte_size')
+        byte_size = size_attr.value if size_attr else 0
 
-            return BaseType(name=name, byte_size=byte_size, encoding=encoding)
+        encoding_attr = attrs.get('DW_AT_encoding')
+        encoding = encoding_attr.value if encoding_attr else DW_ATE_signed
 
-        except Exception:
-            return None
+        return BaseType(name=name, byte_size=byte_size, encoding=encoding)
 
     def _resolve_pointer_type(self, die: DIE) -> Optional[PointerType]:
         """Resolve a pointer type DIE."""
-        try:
-            attrs = die.attributes
-
-            size_attr = attrs.get('DW_AT_byte_size')
-            byte_size = size_attr.value if size_attr else 4
+        attrs = die.attributes
 
-            type_attr = attrs.get('DW_AT_type')
-            pointee_offset = type_attr.value + die.cu.cu_offset if type_attr else None
+        size_attr = attrs.get('DW_AT_byte_size')
+        byte_size = size_attr.value if size_attr else 4
 
-            return PointerType(pointee_offset=pointee_offset, byte_size=byte_size)
+        type_attr = attrs.get('DW_AT_type')
+        pointee_offset = type_attr.value + die.cu.cu_offset if type_attr else None
 
-        except Exception:
-            return None
+        return PointerType(pointee_offset=pointee_offset, byte_size=byte_size)
 
     def _resolve_struct_type(self, die: DIE) -> Optional[StructType]:
         """Resolve a structure type DIE."""
-        try:
-            attrs = die.attributes
+        attrs = die.attributes
 
-            name_attr = attrs.get('DW_AT_name')
-            name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else None
+        name_attr = attrs.get('DW_AT_name')
+        name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else None
+
+        size_attr = attrs.get('DW_AT_byte_size')
+        byte_size = size_attr.value if size_attr else 0
 
-            size_attr = attrs.get('DW_AT_byte_size')
-            byte_size = size_attr.value if size_attr else 0
+        # Members are parsed when the struct is first formatted (type names don't need them)
+        return StructType(name=name, byte_size=byte_size, die=die)
 
-            # Parse members
+    def _parse_struct_members(self, type_obj: StructType) -> List[StructMember]:
+        """Parse the member DIEs of a structure type on first use."""
+        members = type_obj.members
+        if members is None:
+            # Keep the DIE: another thread may be parsing the same struct
             members = []
-            for child in die.iter_children():
+            for child in type_obj.die.iter_children():
                 if child.tag == 'DW_TAG_member':
                     member = self._parse_struct_member(child)
                     if member:
                         members.append(member)
-
-            return StructType(name=name, byte_size=byte_size, members=members)
-
-        except Exception:
-            return None
+            type_obj.members = members
+        return members
 
     def _parse_struct_member(self, die: DIE) -> Optional[StructMember]:
         """Parse a struct member DIE."""
@@ -207,55 +270,54 @@ class TypeResolver:
 
     def _resolve_typedef(self, die: DIE) -> Optional[TypedefType]:
         """Resolve a typedef DIE."""
-        try:
-            attrs = die.attributes
+        attrs = die.attributes
 
-            name_attr = attrs.get('DW_AT_name')
-            name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else 'unnamed'
-
-            type_attr = attrs.get('DW_AT_type')
-            type_offset = type_attr.value + die.cu.cu_offset if type_attr else None
+        name_attr = attrs.get('DW_AT_name')
+        name = name_attr.value.decode('utf-8', errors='ignore') if name_attr else 'unnamed'
 
-            return TypedefType(name=name, type_offset=type_offset)
+        type_attr = attrs.get('DW_AT_type')
+        type_offset = type_attr.value + die.cu.cu_offset if type_attr else None
 
-        except Exception:
-            return None
+        return TypedefType(name=name, type_offset=type_offset)
 
     def _resolve_const_type(self, die: DIE) -> Optional[object]:
         """Resolve a const type DIE by following the underlying type."""
-        try:
-            attrs = die.attributes
-            type_attr = attrs.get('DW_AT_type')
-
-            if type_attr:
-                type_offset = type_attr.value + die.cu.cu_offset
-                return self.resolve_type(type_offset)
+        attrs = die.attributes
+        type_attr = attrs.get('DW_AT_type')
 
-            return None
+        if type_attr:
+            type_offset = type_attr.value + die.cu.cu_offset
+            return self.resolve_type(type_offset)
 
-        except Exception:
-            return None
+        return None
 
     def _resolve_array_type(self, die: DIE) -> Optional[ArrayType]:
         """Resolve an array type DIE."""
-        try:
-            attrs = die.attributes
-
-            type_attr = attrs.get('DW_AT_type')
-            element_type_offset = type_attr.value + die.cu.cu_offset if type_attr else None
-
-            # Array bounds are in subrange DIE
-            element_count = None
-            for child in die.iter_children():
-                if child.tag == 'DW_TAG_subrange_type':
-                    upper_bound = child.attributes.get('DW_AT_upper_bound')
-                    if upper_bound:
-                        element_count = upper_bound.value + 1  # upper_bound is inclusive
-
-            return ArrayType(element_type_offset=element_type_offset, element_count=element_count)
+        attrs = die.attributes
+
+        type_attr = attrs.get('DW_AT_type')
+        element_type_offset = type_attr.value + die.cu.cu_offset if type_attr else None
+
+        # Array bounds are in subrange DIE
+        element_count = None
+        for child in die.iter_children():
+            if child.tag == 'DW_TAG_subrange_type':
+                upper_bound = child.attributes.get('DW_AT_upper_bound')
+                if upper_bound:
+                    element_count = upper_bound.value + 1  # upper_bound is inclusive
+
+        # Resolve the element type once, rather than per formatted element
+        element_type = self.resolve_type(element_type_offset) if element_type_offset else None
+        element_size = None
+        if isinstance(element_type, (BaseType, PointerType)):
+            element_size = element_type.byte_size
 
-        except Exception:
-            return None
+        return ArrayType(
+            element_type_offset=element_type_offset,
+            element_count=element_count,
+            element_type=element_type,
+            element_size=element_size
+        )
 
     def format_value(self, raw_bytes: bytes, type_offset: int, max_depth: int = 3) -> str:
         """Format a raw value based on its type.
@@ -271,68 +333,91 @@ class TypeResolver:
         if max_depth <= 0:
             return "..."
 
+        # Typedefs are already unwrapped to the type they name
+        type_obj = self._alias_cache.get(type_offset, _IN_PROGRESS)
+        if type_obj is _IN_PROGRESS:
+            type_obj = self._resolve_alias(type_offset)
+
+        # One dict lookup on the exact type instead of an isinstance chain
+        type_kind = type(type_obj)
+        formatter = _SCALAR_FORMATTERS.get(type_kind)
+        if formatter:
+            return formatter(self, raw_bytes, type_obj)
+        formatter = _NESTED_FORMATTERS.get(type_kind)
+        if formatter:
+            return formatter(self, raw_bytes, type_obj, max_depth - 1)
+        if type_kind is TypedefType:
+            # Only typedefs without a (non-circular) underlying type are left here
+            return "<unknown typedef>"
+
+        # Unknown type - show hex dump
+        return self._format_hex_dump(raw_bytes)
+
+    def get_scalar_formatter(self, type_offset: int, size: int) -> Optional[Callable[[bytes], str]]:
+        """Get the formatter for a base or pointer type's values.
+
+        This is what format_value dispatches to for the type, so callers that
+        format many values of one type can look it up once and skip the
+        dispatch. Only types that fit in size bytes get one, which keeps the
+        formatter from failing on values read at that size.
+
+        Args:
+            type_offset: DIE offset of the type
+            size: Number of bytes the values will be formatted from
+
+        Returns:
+            Formatter taking the value's raw bytes, or None if format_value has
+            to be used for the type
+        """
+        type_obj = self._alias_cache.get(type_offset, _IN_PROGRESS)
+        if type_obj is _IN_PROGRESS:
+            type_obj = self._resolve_alias(type_offset)
+
+        type_kind = type(type_obj)
+        if type_kind is BaseType and type_obj.byte_size <= size:
+            return (_BASE_FORMATTERS.get((type_obj.byte_size, type_obj.encoding))
+                    or _UNSIGNED_FORMATTERS.get(type_obj.byte_size))
+        if type_kind is PointerType and type_obj.decoder and type_obj.byte_size <= size:
+            decoder, hex_format = type_obj.decoder, type_obj.hex_format
+
+            def format_pointer(raw_bytes: bytes) -> str:
+                return f"0x{decoder.unpack_from(raw_bytes)[0]:{hex_format}}"
+            return format_pointer
+        return None
+
+    def _resolve_alias(self, type_offset: int) -> Optional[object]:
+        """Resolve a type, following typedef chains to the type they name.
+
+        const is already collapsed by resolve_type. The result is cached in
+        _alias_cache so formatting an aliased type is a single lookup.
+
+        Args:
+            type_offset: DIE offset of the type
+
+        Returns:
+            Final type object; a TypedefType only if the chain has no target
+            or loops back on itself
+        """
         type_obj = self.resolve_type(type_offset)
+        seen = {type_offset}
+        while (isinstance(type_obj, TypedefType) and type_obj.type_offset
+               and type_obj.type_offset not in seen):
+            seen.add(type_obj.type_offset)
+            type_obj = self.resolve_type(type_obj.type_offset)
 
-        if isinstance(type_obj, BaseType):
-            return self._format_base_type(raw_bytes, type_obj)
-        elif isinstance(type_obj, PointerType):
-            return self._format_pointer(raw_bytes, type_obj)
-        elif isinstance(type_obj, StructType):
-            return self._format_struct(raw_bytes, type_obj, max_depth - 1)
-        elif isinstance(type_obj, TypedefType):
-            # Follow typedef to underlying type
-            if type_obj.type_offset:
-                return self.format_value(raw_bytes, type_obj.type_offset, max_depth)
-            return "<unknown typedef>"
-        elif isinstance(type_obj, ArrayType):
-            return self._format_array(raw_bytes, type_obj, max_depth - 1)
-        else:
-            # Unknown type - show hex dump
-            return self._format_hex_dump(raw_bytes)
+        self._alias_cache[type_offset] = type_obj
+        return type_obj
 
     def _format_base_type(self, raw_bytes: bytes, type_obj: BaseType) -> str:
         """Format a base type value."""
+        # Signed/float encodings have their own formatter; everything else of a
+        # supported size is shown as unsigned
+        formatter = (_BASE_FORMATTERS.get((type_obj.byte_size, type_obj.encoding))
+                     or _UNSIGNED_FORMATTERS.get(type_obj.byte_size))
         try:
-            if type_obj.byte_size == 1:
-                if type_obj.encoding in (DW_ATE_signed, DW_ATE_signed_char):
-                    value = struct.unpack('<b', raw_bytes[:1])[0]
-                    return str(value)
-                else:
-                    value = struct.unpack('<B', raw_bytes[:1])[0]
-                    return str(value)
-
-            elif type_obj.byte_size == 2:
-                if type_obj.encoding == DW_ATE_signed:
-                    value = struct.unpack('<h', raw_bytes[:2])[0]
-                    return str(value)
-                else:
-                    value = struct.unpack('<H', raw_bytes[:2])[0]
-                    return str(value)
-
-            elif type_obj.byte_size == 4:
-                if type_obj.encoding == DW_ATE_signed:
-                    value = struct.unpack('<i', raw_bytes[:4])[0]
-                    return str(value)
-                elif type_obj.encoding == DW_ATE_float:
-                    value = struct.unpack('<f', raw_bytes[:4])[0]
-                    return f"{value:.6g}"
-                else:
-                    value = struct.unpack('<I', raw_bytes[:4])[0]
-                    return str(value)
-
-            elif type_obj.byte_size == 8:
-                if type_obj.encoding == DW_ATE_signed:
-                    value = struct.unpack('<q', raw_bytes[:8])[0]
-                    return str(value)
-                elif type_obj.encoding == DW_ATE_float:
-                    value = struct.unpack('<d', raw_bytes[:8])[0]
-                    return f"{value:.15g}"
-                else:
-                    value = struct.unpack('<Q', raw_bytes[:8])[0]
-                    return str(value)
-
-            else:
-                return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
+            if formatter:
+                return formatter(raw_bytes)
+            return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
 
         except Exception:
             return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
@@ -340,28 +425,30 @@ class TypeResolver:
     def _format_pointer(self, raw_bytes: bytes, type_obj: PointerType) -> str:
         """Format a pointer value."""
         try:
-            if type_obj.byte_size == 4:
-                value = struct.unpack('<I', raw_bytes[:4])[0]
-                return f"0x{value:08x}"
-            elif type_obj.byte_size == 8:
-                value = struct.unpack('<Q', raw_bytes[:8])[0]
-                return f"0x{value:016x}"
-            else:
-                return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
+            if type_obj.decoder:
+                value = type_obj.decoder.unpack_from(raw_bytes)[0]
+                return f"0x{value:{type_obj.hex_format}}"
+            return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
         except Exception:
             return self._format_hex_dump(raw_bytes[:type_obj.byte_size])
 
     def _format_struct(self, raw_bytes: bytes, type_obj: StructType, max_depth: int) -> str:
         """Format a structure value."""
-        if not type_obj.members:
+        try:
+            members = self._parse_struct_members(type_obj)
+        except Exception:
+            # Malformed member DIEs - the struct can't be decoded
+            return self._format_hex_dump(raw_bytes)
+        if not members:
             return "{}"
 
+        # Members are formatted from zero-copy views of the struct's bytes
+        view = memoryview(raw_bytes)
         parts = ["{"]
-        for member in type_obj.members:
+        for member in members:
             if member.type_offset and member.offset < len(raw_bytes):
-                member_bytes = raw_bytes[member.offset:]
-                member_value = self.format_value(member_bytes, member.type_offset, max_depth)
-                parts.append(f" {member.name}={member_value}")
+                parts.append(member.name_prefix)
+                parts.append(self.format_value(view[member.offset:], member.type_offset, max_depth))
         parts.append(" }")
         return "".join(parts)
 
@@ -370,36 +457,38 @@ class TypeResolver:
         if not type_obj.element_type_offset:
             return "[...]"
 
-        # Resolve element type to get size
-        element_type = self.resolve_type(type_obj.element_type_offset)
-        if isinstance(element_type, BaseType):
-            element_size = element_type.byte_size
-        elif isinstance(element_type, PointerType):
-            element_size = element_type.byte_size
-        else:
+        # Only base type and pointer elements are formatted
+        element_size = type_obj.element_size
+        if element_size is None:
             return "[...]"
 
-        # Show first few elements
+        element_type = type_obj.element_type
+        if max_depth <= 0:
+            format_element = None
+        elif isinstance(element_type, BaseType):
+            format_element = self._format_base_type
+        else:
+            format_element = self._format_pointer
+
+        # Show first few elements (those that fit in the bytes read), decoded
+        # from zero-copy views of the array's bytes
+        view = memoryview(raw_bytes)
         max_elements = min(type_obj.element_count or 3, 3)
-        parts = ["["]
-        for i in range(max_elements):
-            offset = i * element_size
-            if offset + element_size <= len(raw_bytes):
-                element_bytes = raw_bytes[offset:offset + element_size]
-                element_value = self.format_value(element_bytes, type_obj.element_type_offset, max_depth)
-                if i > 0:
-                    parts.append(", ")
-                parts.append(element_value)
-        if type_obj.element_count and type_obj.element_count > max_elements:
-            parts.append(", ...")
-        parts.append("]")
-        return "".join(parts)
+        offsets = [i * element_size for i in range(max_elements)
+                   if (i + 1) * element_size <= len(raw_bytes)]
+        if format_element is None:
+            elements = ["..."] * len(offsets)
+        else:
+            elements = [format_element(view[offset:offset + element_size], element_type)
+                        for offset in offsets]
+        tail = ", ..." if type_obj.element_count and type_obj.element_count > max_elements else ""
+        return "[" + ", ".join(elements) + tail + "]"
 
     def _format_hex_dump(self, raw_bytes: bytes) -> str:
         """Format raw bytes as hex dump."""
         if len(raw_bytes) == 0:
             return "<empty>"
-        hex_str = " ".join(f"{b:02x}" for b in raw_bytes[:16])
+        hex_str = raw_bytes[:16].hex(" ")
         if len(raw_bytes) > 16:
             hex_str += "..."
         return f"<{hex_str}>"
@@ -413,6 +502,14 @@ class TypeResolver:
         Returns:
             Type name string
         """
+        name = self._name_cache.get(type_offset)
+        if name is None:
+            name = self._build_type_name(type_offset)
+            self._name_cache[type_offset] = name
+        return name
+
+    def _build_type_name(self, type_offset: int) -> str:
+        """Uncached type name lookup backing get_type_name()."""
         type_obj = self.resolve_type(type_offset)
 
         if isinstance(type_obj, BaseType):
@@ -437,3 +534,25 @@ class TypeResolver:
             return "array"
         else:
             return "unknown"
+
+
+# Resolved type class -> formatter used by TypeResolver.format_value.
+# Nested formatters also take the remaining depth.
+_SCALAR_FORMATTERS = {
+    BaseType: TypeResolver._format_base_type,
+    PointerType: TypeResolver._format_pointer,
+}
+_NESTED_FORMATTERS = {
+    StructType: TypeResolver._format_struct,
+    ArrayType: TypeResolver._format_array,
+}
+
+# DIE tag -> resolver used by TypeResolver.resolve_type
+_RESOLVERS = {
+    'DW_TAG_base_type': TypeResolver._resolve_base_type,
+    'DW_TAG_pointer_type': TypeResolver._resolve_pointer_type,
+    'DW_TAG_structure_type': TypeResolver._resolve_struct_type,
+    'DW_TAG_typedef': TypeResolver._resolve_typedef,
+    'DW_TAG_const_type': TypeResolver._resolve_const_type,
+    'DW_TAG_array_type': TypeResolver._resolve_array_type,
+}
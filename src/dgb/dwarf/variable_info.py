@@ -6,10 +6,11 @@ to provide complete variable inspection at breakpoints.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from functools import partial
+from typing import Callable, List, Optional, TYPE_CHECKING
 import struct
 
-from dgb.dwarf.die_parser import DIEParser, SubprogramInfo, VariableInfo as DIEVariableInfo
+from dgb.dwarf.die_parser import DIEParser, VariableInfo as DIEVariableInfo
 from dgb.dwarf.location_eval import LocationEvaluator, LocationEvaluationError
 from dgb.dwarf.type_info import TypeResolver
 
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from elftools.dwarf.dwarfinfo import DWARFInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable:
     """Represents an inspected variable with all information."""
 
@@ -30,6 +31,58 @@ class Variable:
     is_parameter: bool
 
 
+# Variables whose memory is at most this many bytes apart are fetched with one read
+_READ_MERGE_GAP = 64
+
+# Register values are formatted as the 4 little-endian bytes they'd occupy in memory
+_U32 = struct.Struct('<I')
+
+
+@dataclass(slots=True)
+class _ResolvedType:
+    """What VariableInspector needs to show values of one type, resolved once."""
+
+    name: str
+    read_size: int  # Bytes to read for a value held in memory
+    format_bytes: Callable[[bytes], str]  # Formats read_size bytes read from memory
+    format_register: Callable[[int], str]  # Formats a value held in a register
+
+
+class _PrefetchedMemory:
+    """Memory reader that fetches a set of ranges with as few reads as possible.
+
+    Ranges that overlap or lie close together (a frame's locals usually do) are
+    merged and read once. Reads not covered by a prefetched block, or whose
+    block couldn't be read as a whole, go to the process controller directly,
+    so failures are still reported per variable.
+    """
+
+    def __init__(self, process_controller: 'ProcessController', ranges: List[tuple]):
+        self._process_controller = process_controller
+        self._blocks: List[tuple] = []  # (start, data)
+
+        # Merge sorted (address, size) ranges into blocks
+        merged = []
+        for address, size in sorted(r for r in ranges if r[1] > 0):
+            if merged and address <= merged[-1][1] + _READ_MERGE_GAP:
+                merged[-1][1] = max(merged[-1][1], address + size)
+            else:
+                merged.append([address, address + size])
+
+        for start, end in merged:
+            try:
+                self._blocks.append((start, process_controller.read_memory(start, end - start)))
+            except Exception:
+                # Part of the block is unreadable - fall back to per-variable reads
+                continue
+
+    def read_memory(self, address: int, size: int) -> bytes:
+        for start, data in self._blocks:
+            if start <= address and address + size <= start + len(data):
+                return data[address - start:address - start + size]
+        return self._process_controller.read_memory(address, size)
+
+
 class VariableInspector:
     """High-level variable inspector.
 
@@ -46,6 +99,17 @@ class VariableInspector:
         self.location_evaluator = LocationEvaluator(process_controller)
         self.type_resolver = TypeResolver(self.die_parser)
 
+        # type_offset -> name, read size and formatters for that type
+        self._resolved_types: dict[int, _ResolvedType] = {}
+
+        # State of the current stop: thread_id -> registers, and
+        # (subprogram, thread_id, module_base) -> frame base. Registers don't
+        # change while the process is stopped; both are dropped once the
+        # process controller reports that it has resumed.
+        self._registers: dict[int, dict] = {}
+        self._frame_bases: dict[tuple, int] = {}
+        self._stop_generation = process_controller.stop_generation
+
     def get_variables_at_address(
         self,
         address: int,
@@ -70,70 +134,80 @@ class VariableInspector:
         if not subprogram:
             return variables  # No function found at this address
 
-        # Evaluate frame base (usually EBP)
-        frame_base = self._evaluate_frame_base(subprogram, thread_id, module_base)
-
         # Get all variables in the subprogram
         die_variables = self.die_parser.get_variables_in_subprogram(subprogram)
 
+        # Evaluate the frame base (usually EBP) and every location expression
+        # in one batch, against a single read of the thread's registers.
+        # Constants and variables without a location don't need evaluating.
+        # The registers and frame base are reused if they were already read at
+        # this stop.
+        if self._stop_generation != self.process_controller.stop_generation:
+            self.invalidate()
+        registers = self._registers.get(thread_id)
+        if registers is None:
+            try:
+                registers = self.process_controller.get_all_registers(thread_id)
+                self._registers[thread_id] = registers
+            except Exception:
+                # Left to the evaluator, which reports the failure per variable
+                registers = None
+        frame_base_key = (id(subprogram), thread_id, module_base)
+        exprs = [
+            None if die_var.const_value is not None else (die_var.location or None)
+            for die_var in die_variables
+        ]
+        frame_base, locations = self.location_evaluator.evaluate_locations_batch(
+            exprs,
+            thread_id,
+            subprogram.frame_base,
+            module_base,
+            frame_base=self._frame_bases.get(frame_base_key),
+            registers=registers
+        )
+        if frame_base is not None:
+            self._frame_bases[frame_base_key] = frame_base
+
+        # Read the memory of every stack/global variable up front, coalescing
+        # neighbouring variables into as few reads as possible
+        reads = []
+        for die_var, location_result in zip(die_variables, locations):
+            if (isinstance(location_result, int) and die_var.type_offset
+                    and die_var.location_type != 'register'):
+                reads.append((location_result, self._resolve_type(die_var.type_offset).read_size))
+        memory = _PrefetchedMemory(self.process_controller, reads)
+
         # Inspect each variable
-        for die_var in die_variables:
-            var = self._inspect_variable(die_var, thread_id, frame_base, module_base)
+        for die_var, location_result in zip(die_variables, locations):
+            var = self._inspect_variable(die_var, location_result, memory)
             if var:
                 variables.append(var)
 
         return variables
 
-    def _evaluate_frame_base(
-        self,
-        subprogram: SubprogramInfo,
-        thread_id: int,
-        module_base: int
-    ) -> Optional[int]:
-        """Evaluate the frame base for a subprogram.
-
-        Args:
-            subprogram: Subprogram information
-            thread_id: Thread ID for register access
-            module_base: Module base address
+    def invalidate(self):
+        """Forget state cached for the current stop.
 
-        Returns:
-            Frame base address (usually EBP value) or None
+        Called automatically once the process has been resumed.
         """
-        if not subprogram.frame_base:
-            # No frame base - try to use EBP directly
-            try:
-                return self.process_controller.get_register(thread_id, 'ebp')
-            except Exception:
-                return None
-
-        try:
-            return self.location_evaluator.evaluate_frame_base(
-                subprogram.frame_base,
-                thread_id,
-                module_base
-            )
-        except LocationEvaluationError:
-            # Fallback to EBP if frame base evaluation fails
-            try:
-                return self.process_controller.get_register(thread_id, 'ebp')
-            except Exception:
-                return None
+        self._registers.clear()
+        self._frame_bases.clear()
+        self._stop_generation = self.process_controller.stop_generation
 
     def _inspect_variable(
         self,
         die_var: DIEVariableInfo,
-        thread_id: int,
-        frame_base: Optional[int],
-        module_base: int
+        location_result,
+        memory: '_PrefetchedMemory'
     ) -> Optional[Variable]:
         """Inspect a single variable.
 
         Args:
             die_var: Variable information from DIE parser
-            thread_id: Thread ID for access
-            frame_base: Frame base address
-            module_base: Module base address
+            location_result: Result of evaluating the variable's location
+                expression: the computed address (or register value), the
+                exception raised while evaluating it, or None if not evaluated
+            memory: Memory reader for the current stop
 
         Returns:
             Variable object with all information, or None if inspection fails
@@ -141,20 +215,15 @@ class VariableInspector:
         # Get type name
         type_name = 'unknown'
         if die_var.type_offset:
-            try:
-                type_name = self.type_resolver.get_type_name(die_var.type_offset)
-            except Exception:
-                pass
+            type_name = self._resolve_type(die_var.type_offset).name
 
         # Check for constant value (optimized-out variable with known value)
-        const_value_attr = die_var.die.attributes.get('DW_AT_const_value')
-        if const_value_attr:
+        if die_var.const_value is not None:
             # Variable has constant value
-            const_val = const_value_attr.value
             return Variable(
                 name=die_var.name,
                 type_name=type_name,
-                value=str(const_val),
+                value=str(die_var.const_value),
                 location='constant',
                 address=None,
                 is_parameter=die_var.is_parameter
@@ -172,17 +241,13 @@ class VariableInspector:
                 is_parameter=die_var.is_parameter
             )
 
-        # Try to evaluate location expression
         try:
-            var_address = self.location_evaluator.evaluate_location(
-                die_var.location,
-                thread_id,
-                frame_base,
-                module_base
-            )
+            if isinstance(location_result, Exception):
+                raise location_result
+            var_address = location_result
 
-            # Determine location type based on expression
-            location_type = self._determine_location_type(die_var.location)
+            # Location type, determined from the expression when it was parsed
+            location_type = die_var.location_type
 
             # For register-held values, the "address" is actually the value itself
             if location_type == 'register':
@@ -198,7 +263,7 @@ class VariableInspector:
                 )
 
             # For stack/global, read memory at the address
-            value_str = self._read_and_format_value(var_address, die_var.type_offset)
+            value_str = self._read_and_format_value(var_address, die_var.type_offset, memory)
 
             return Variable(
                 name=die_var.name,
@@ -230,38 +295,6 @@ class VariableInspector:
                 is_parameter=die_var.is_parameter
             )
 
-    def _determine_location_type(self, location_expr: bytes) -> str:
-        """Determine the type of location (stack, register, global).
-
-        Args:
-            location_expr: Location expression bytes
-
-        Returns:
-            'stack', 'register', 'global', or 'unknown'
-        """
-        if not location_expr:
-            return 'unknown'
-
-        opcode = location_expr[0]
-
-        # DW_OP_reg* (0x50-0x6F) - register
-        if 0x50 <= opcode <= 0x6F:
-            return 'register'
-
-        # DW_OP_fbreg (0x91) - frame base relative (stack)
-        if opcode == 0x91:
-            return 'stack'
-
-        # DW_OP_breg* (0x70-0x8F) - base register + offset (usually stack)
-        if 0x70 <= opcode <= 0x8F:
-            return 'stack'
-
-        # DW_OP_addr (0x03) - absolute address (global)
-        if opcode == 0x03:
-            return 'global'
-
-        return 'unknown'
-
     def _format_register_value(self, value: int, type_offset: Optional[int]) -> str:
         """Format a value that's held in a register.
 
@@ -276,18 +309,64 @@ class VariableInspector:
             return f"0x{value:08x}"
 
         try:
-            # Pack the value as 4 bytes and format according to type
-            raw_bytes = struct.pack('<I', value & 0xFFFFFFFF)
-            return self.type_resolver.format_value(raw_bytes, type_offset)
+            return self._resolve_type(type_offset).format_register(value)
         except Exception:
             return f"0x{value:08x}"
 
-    def _read_and_format_value(self, address: int, type_offset: Optional[int]) -> str:
+    def _resolve_type(self, type_offset: int) -> _ResolvedType:
+        """Get the name, read size and formatters for a type."""
+        resolved = self._resolved_types.get(type_offset)
+        if resolved is None:
+            resolved = self._build_resolved_type(type_offset)
+            self._resolved_types[type_offset] = resolved
+        return resolved
+
+    def _build_resolved_type(self, type_offset: int) -> _ResolvedType:
+        """Resolve a type for display, backing _resolve_type().
+
+        Base types and pointers that fit in the bytes being formatted use their
+        scalar formatter directly; anything else goes through
+        TypeResolver.format_value. Register values are packed as the 4 bytes
+        they'd occupy in memory.
+        """
+        type_resolver = self.type_resolver
+        try:
+            name = type_resolver.get_type_name(type_offset)
+        except Exception:
+            name = 'unknown'
+
+        type_obj = type_resolver.resolve_type(type_offset)
+        read_size = 4  # Default size
+        if hasattr(type_obj, 'byte_size'):
+            read_size = type_obj.byte_size
+
+        format_value = partial(type_resolver.format_value, type_offset=type_offset)
+        format_bytes = type_resolver.get_scalar_formatter(type_offset, read_size) or format_value
+        format_register_bytes = type_resolver.get_scalar_formatter(type_offset, _U32.size) or format_value
+        pack = _U32.pack
+
+        def format_register(value: int) -> str:
+            return format_register_bytes(pack(value & 0xFFFFFFFF))
+
+        return _ResolvedType(
+            name=name,
+            read_size=read_size,
+            format_bytes=format_bytes,
+            format_register=format_register
+        )
+
+    def _read_and_format_value(
+        self,
+        address: int,
+        type_offset: Optional[int],
+        memory: '_PrefetchedMemory'
+    ) -> str:
         """Read memory at address and format according to type.
 
         Args:
             address: Memory address to read
             type_offset: Type offset for formatting
+            memory: Memory reader for the current stop
 
         Returns:
             Formatted string
@@ -298,17 +377,13 @@ class VariableInspector:
 
         try:
             # Determine size to read from type
-            type_obj = self.type_resolver.resolve_type(type_offset)
-
-            size = 4  # Default size
-            if hasattr(type_obj, 'byte_size'):
-                size = type_obj.byte_size
+            resolved = self._resolve_type(type_offset)
 
             # Read memory
-            raw_bytes = self.process_controller.read_memory(address, size)
+            raw_bytes = memory.read_memory(address, resolved.read_size)
 
             # Format according to type
-            return self.type_resolver.format_value(raw_bytes, type_offset)
+            return resolved.format_bytes(raw_bytes)
 
         except Exception as e:
             return f"<unreadable: {e}>"
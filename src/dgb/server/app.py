@@ -5,17 +5,20 @@ Provides HTTP transport for Model Context Protocol via JSON-RPC 2.0.
 """
 
 import asyncio
+import atexit
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from litestar import Litestar, post, Request, Response
+from litestar import Litestar, post, Response
 from litestar.config.cors import CORSConfig
 from litestar.logging import LoggingConfig
 from litestar.status_codes import HTTP_200_OK
 
 from dgb.server.session_manager import SessionManager
 from dgb.server.mcp_handler import MCPHandler
+from dgb.server.debugger_wrapper import DEFAULT_COMMAND_TIMEOUT
 
 # Configure logging
 logging_config = LoggingConfig(
@@ -32,52 +35,80 @@ logging_config = LoggingConfig(
 
 logger = logging.getLogger(__name__)
 
+# Default number of worker threads for running MCP requests, sized like the
+# event loop's default executor. continue, step and run hold a worker while
+# they wait for the debuggee, so every busy session takes one worker and the
+# pool must leave room for the other sessions' requests (and tools/list).
+DEFAULT_HANDLER_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
 
 # Application state
 class AppState:
     """Application state container."""
     session_manager: SessionManager
     mcp_handler: MCPHandler
+    handler_executor: ThreadPoolExecutor
 
 
 # HTTP endpoint
-@post("/mcp/v1")
-async def mcp_endpoint(request: Request, data: dict[str, Any]) -> Response[dict]:
-    """MCP protocol endpoint.
+def _create_mcp_endpoint(mcp_handler: MCPHandler, handler_executor: ThreadPoolExecutor):
+    """Create the MCP route handler.
 
-    Handles JSON-RPC 2.0 messages for MCP protocol.
+    The handler and thread pool are bound when the app is built, so requests
+    don't look them up on the app state.
 
     Args:
-        request: Litestar request
-        data: JSON-RPC request data
+        mcp_handler: Handler for MCP protocol messages
+        handler_executor: Thread pool that runs the handler
 
     Returns:
-        JSON-RPC response
+        Litestar route handler for the MCP endpoint
     """
-    # Get handler from app state
-    mcp_handler: MCPHandler = request.app.state.mcp_handler
+    @post("/mcp/v1")
+    async def mcp_endpoint(data: dict[str, Any]) -> Response[dict]:
+        """MCP protocol endpoint.
 
-    # CRITICAL: Run the sync handler in a thread pool to avoid blocking the async event loop
-    # This prevents deadlocks when sync operations (like debugger cleanup) take time
-    response_data = await asyncio.to_thread(mcp_handler.handle_request, data)
+        Handles JSON-RPC 2.0 messages for MCP protocol.
 
-    return Response(
-        content=response_data,
-        status_code=HTTP_200_OK
-    )
+        Args:
+            data: JSON-RPC request data
+
+        Returns:
+            JSON-RPC response
+        """
+        # CRITICAL: Run the sync handler in a thread pool to avoid blocking the async event loop
+        # This prevents deadlocks when sync operations (like debugger cleanup) take time.
+        # The pool is dedicated to MCP requests, so they don't compete with other
+        # users of the loop's default executor.
+        loop = asyncio.get_running_loop()
+        response_data = await loop.run_in_executor(handler_executor, mcp_handler.handle_request, data)
+
+        return Response(
+            content=response_data,
+            status_code=HTTP_200_OK
+        )
 
+    return mcp_endpoint
 
-def create_app(session_timeout: float = 3600.0) -> Litestar:
+
+def create_app(session_timeout: float = 3600.0,
+               command_timeout: float = DEFAULT_COMMAND_TIMEOUT,
+               handler_threads: int = DEFAULT_HANDLER_THREADS) -> Litestar:
     """Create and configure Litestar application.
 
     Args:
         session_timeout: Session timeout in seconds
+        command_timeout: Time to wait for a debugger command in seconds
+        handler_threads: Number of threads that run MCP requests
 
     Returns:
         Configured Litestar application
     """
     # Create session manager
-    session_manager = SessionManager(session_timeout=session_timeout)
+    session_manager = SessionManager(
+        session_timeout=session_timeout,
+        command_timeout=command_timeout
+    )
 
     # Create MCP handler
     mcp_handler = MCPHandler(session_manager)
@@ -86,6 +117,33 @@ def create_app(session_timeout: float = 3600.0) -> Litestar:
     state = AppState()
     state.session_manager = session_manager
     state.mcp_handler = mcp_handler
+    state.handler_executor = ThreadPoolExecutor(
+        max_workers=handler_threads,
+        thread_name_prefix='mcp'
+    )
+
+    def register_exit_cleanup() -> None:
+        """Also close sessions if the interpreter exits without a clean shutdown.
+
+        Registered on startup rather than in create_app, so apps that are
+        built but never served (like the module-level one) don't register.
+        """
+        atexit.register(session_manager.close_all_sessions)
+
+    def close_sessions() -> None:
+        """Stop every debugged process.
+
+        Runs before the handler pool is shut down: once the debuggees are
+        gone, requests waiting on them return instead of running into their
+        timeouts.
+        """
+        logger.info("Shutting down...")
+        session_manager.close_all_sessions()
+        atexit.unregister(session_manager.close_all_sessions)
+
+    def shutdown_handler_executor() -> None:
+        """Let in-flight requests finish and drop queued ones on shutdown."""
+        state.handler_executor.shutdown(wait=True, cancel_futures=True)
 
     # CORS configuration (allow MCP clients from any origin)
     cors_config = CORSConfig(
@@ -96,20 +154,30 @@ def create_app(session_timeout: float = 3600.0) -> Litestar:
 
     # Create Litestar app
     app = Litestar(
-        route_handlers=[mcp_endpoint],
+        route_handlers=[_create_mcp_endpoint(mcp_handler, state.handler_executor)],
         state=state,
         cors_config=cors_config,
         logging_config=logging_config,
+        on_startup=[register_exit_cleanup],
+        on_shutdown=[close_sessions, shutdown_handler_executor],
         debug=False
     )
 
     logger.info("DGB MCP Server initialized")
     logger.info(f"Session timeout: {session_timeout}s")
+    logger.info(f"Command timeout: {command_timeout}s")
+    logger.info(f"Handler threads: {handler_threads}")
 
     return app
 
 
 # Module-level app instance for Uvicorn reload mode
-# Gets session timeout from environment variable if set
+# Gets session and command timeouts and the thread count from environment variables if set
 _session_timeout = float(os.environ.get('DGB_SESSION_TIMEOUT', '3600.0'))
-app = create_app(session_timeout=_session_timeout)
+_command_timeout = float(os.environ.get('DGB_COMMAND_TIMEOUT', str(DEFAULT_COMMAND_TIMEOUT)))
+_handler_threads = int(os.environ.get('DGB_HANDLER_THREADS', str(DEFAULT_HANDLER_THREADS)))
+app = create_app(
+    session_timeout=_session_timeout,
+    command_timeout=_command_timeout,
+    handler_threads=_handler_threads
+)
@@ -7,14 +7,19 @@ and provides thread-safe communication mechanisms for async HTTP handlers.
 
 import threading
 import queue
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from enum import Enum
 from typing import Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dgb.debugger.core import Debugger
 from dgb.debugger.state import StopInfo
 
 
+# Default time to wait for the debugger thread to finish a command, in seconds
+DEFAULT_COMMAND_TIMEOUT = 30.0
+
+
 class CommandType(Enum):
     """Commands that can be sent to the debugger thread."""
     START = "start"
@@ -24,18 +29,16 @@ class CommandType(Enum):
     STOP = "stop"
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Command to send to debugger thread."""
     type: CommandType
-    args: dict = None
-
-    def __post_init__(self):
-        if self.args is None:
-            self.args = {}
+    args: dict = field(default_factory=dict)
+    # Resolved with the CommandResult by the debugger thread
+    future: Future = field(default_factory=Future)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result from a command execution."""
     success: bool
@@ -50,18 +53,21 @@ class DebuggerWrapper:
     thread-safe methods for controlling the debugger from async HTTP handlers.
     """
 
-    def __init__(self, debugger: Debugger):
+    def __init__(self, debugger: Debugger, command_timeout: float = DEFAULT_COMMAND_TIMEOUT):
         """Initialize wrapper.
 
         Args:
             debugger: Debugger instance to wrap
+            command_timeout: Default time to wait for a command, in seconds
         """
         self.debugger = debugger
+        self.command_timeout = command_timeout
         self.command_queue: queue.Queue[Command] = queue.Queue()
-        self.result_queue: queue.Queue[CommandResult] = queue.Queue()
         self.state_lock = threading.Lock()
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        # (stop_info, state, dict) of the last stop converted by _get_stop_info
+        self._stop_info_cache: Optional[tuple] = None
 
     def start_in_background(self) -> CommandResult:
         """Start the debugger and begin event loop in background thread.
@@ -126,25 +132,21 @@ class DebuggerWrapper:
         """Background thread worker that runs the debugger event loop.
 
         This thread:
-        1. Checks for commands from the command queue
-        2. Executes commands
-        3. Runs the debugger event loop when process is running
+        1. Waits for commands from the command queue
+        2. Executes commands (which run the debugger event loop as needed)
+        3. Hands each result back through the command's future
         """
         while self.running:
-            # Check for commands (non-blocking)
-            try:
-                cmd = self.command_queue.get(timeout=0.1)
-                result = self._execute_command(cmd)
-                self.result_queue.put(result)
-            except queue.Empty:
-                pass
-
-            # Process debug events if the debugger is active
-            # The event loop will poll with timeout, so this won't block forever
-            if self.debugger.waiting_for_event:
-                # Event loop will process events until stopped or quit
-                # It has internal timeout, so this is safe to call
-                pass  # Event loop is managed by commands
+            # Block until a command arrives - debug events are only processed
+            # by commands, so there is nothing to poll for in between
+            cmd = self.command_queue.get()
+            result = self._execute_command(cmd)
+            cmd.future.set_result(result)
+
+            # STOP ends the thread even if stopping the debugger failed -
+            # nothing would be left to send it another command
+            if cmd.type == CommandType.STOP:
+                break
 
     def _execute_command(self, cmd: Command) -> CommandResult:
         """Execute a command on the debugger.
@@ -172,30 +174,27 @@ class DebuggerWrapper:
                     if not location:
                         return CommandResult(success=False, error="No location provided")
 
-                    success = self.debugger.set_breakpoint(location)
-                    if success:
+                    bp = self.debugger.set_breakpoint(location)
+                    if bp:
                         # Get breakpoint info
-                        bp_list = self.debugger.breakpoint_manager.get_all_breakpoints()
-                        if bp_list:
-                            last_bp = bp_list[-1]
-                            data = {
-                                'breakpoint_id': last_bp.id,
-                                'status': last_bp.status
-                            }
-
-                            if last_bp.status == "active":
-                                data.update({
-                                    'address': last_bp.address,
-                                    'file': last_bp.file,
-                                    'line': last_bp.line,
-                                    'module_name': last_bp.module_name
-                                })
-                            else:  # pending
-                                data.update({
-                                    'pending_location': last_bp.pending_location
-                                })
-
-                            return CommandResult(success=True, data=data)
+                        data = {
+                            'breakpoint_id': bp.id,
+                            'status': bp.status
+                        }
+
+                        if bp.status == "active":
+                            data.update({
+                                'address': bp.address,
+                                'file': bp.file,
+                                'line': bp.line,
+                                'module_name': bp.module_name
+                            })
+                        else:  # pending
+                            data.update({
+                                'pending_location': bp.pending_location
+                            })
+
+                        return CommandResult(success=True, data=data)
                     return CommandResult(success=False, error="Failed to set breakpoint")
 
                 elif cmd.type == CommandType.STOP:
@@ -212,16 +211,23 @@ class DebuggerWrapper:
     def _get_stop_info(self) -> dict:
         """Get current stop information as a dictionary.
 
+        A new StopInfo is created for every stop, so the dictionary (and the
+        source line lookup behind it) is reused until the stop or state changes.
+
         Returns:
-            Dictionary with stop info
+            Dictionary with stop info (shared - don't modify it)
         """
-        if not self.debugger.context.stop_info:
+        context = self.debugger.context
+        if not context.stop_info:
             return {
-                'state': self.debugger.context.state.value,
+                'state': context.state.value,
                 'stopped': False
             }
 
-        stop_info = self.debugger.context.stop_info
+        stop_info = context.stop_info
+        cache = self._stop_info_cache
+        if cache and cache[0] is stop_info and cache[1] is context.state:
+            return cache[2]
 
         # Try to resolve source location
         source_location = None
@@ -233,8 +239,8 @@ class DebuggerWrapper:
                     'line': result[1]
                 }
 
-        return {
-            'state': self.debugger.context.state.value,
+        info = {
+            'state': context.state.value,
             'stopped': True,
             'reason': stop_info.reason,
             'address': stop_info.address,
@@ -242,13 +248,15 @@ class DebuggerWrapper:
             'module_name': stop_info.module_name,
             'source_location': source_location
         }
+        self._stop_info_cache = (stop_info, context.state, info)
+        return info
 
-    def send_command(self, cmd: Command, timeout: float = 30.0) -> CommandResult:
+    def send_command(self, cmd: Command, timeout: Optional[float] = None) -> CommandResult:
         """Send a command to the debugger thread and wait for result.
 
         Args:
             cmd: Command to send
-            timeout: Timeout in seconds
+            timeout: Timeout in seconds (default: the wrapper's command_timeout)
 
         Returns:
             CommandResult from command execution
@@ -256,23 +264,34 @@ class DebuggerWrapper:
         if not self.running and cmd.type != CommandType.STOP:
             return CommandResult(success=False, error="Debugger not running")
 
-        # Clear result queue
-        while not self.result_queue.empty():
-            try:
-                self.result_queue.get_nowait()
-            except queue.Empty:
-                break
-
         # Send command
         self.command_queue.put(cmd)
 
-        # Wait for result
+        # Wait for its result - each command carries its own future, so
+        # concurrent callers can't pick up each other's results
+        if timeout is None:
+            timeout = self.command_timeout
         try:
-            result = self.result_queue.get(timeout=timeout)
-            return result
-        except queue.Empty:
+            return cmd.future.result(timeout=timeout)
+        except FutureTimeoutError:
             return CommandResult(success=False, error="Command timeout")
 
+    def abandon(self):
+        """Fail every queued command without running it.
+
+        Used when the session is closed while no thread consumes the command
+        queue (in the server, commands are only queued, never run by the
+        wrapper's own thread), so callers waiting in send_command return
+        now instead of when their timeout runs out.
+        """
+        self.running = False
+        while True:
+            try:
+                cmd = self.command_queue.get_nowait()
+            except queue.Empty:
+                break
+            cmd.future.set_result(CommandResult(success=False, error="Session closed"))
+
     def get_state(self) -> dict:
         """Get current debugger state (thread-safe).
 
@@ -6,12 +6,11 @@ Starts the MCP server with Uvicorn.
 
 import argparse
 import logging
-import sys
-import signal
 
 import uvicorn
 
-from dgb.server.app import create_app
+from dgb.server.app import create_app, DEFAULT_HANDLER_THREADS
+from dgb.server.debugger_wrapper import DEFAULT_COMMAND_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +37,20 @@ def main():
         default=3600.0,
         help="Session timeout in seconds (default: 3600)"
     )
+    parser.add_argument(
+        "--command-timeout",
+        type=float,
+        default=DEFAULT_COMMAND_TIMEOUT,
+        help="Time to wait for a debugger command (continue, step, ...) in seconds "
+             f"(default: {DEFAULT_COMMAND_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--handler-threads",
+        type=int,
+        default=DEFAULT_HANDLER_THREADS,
+        help="Number of threads that run MCP requests; each running continue/step "
+             f"holds one (default: {DEFAULT_HANDLER_THREADS})"
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -66,9 +79,11 @@ def main():
 
     if args.reload:
         # In reload mode, pass app as import string
-        # Store session_timeout in env var for app factory
+        # Store timeouts and handler_threads in env vars for app factory
         import os
         os.environ['DGB_SESSION_TIMEOUT'] = str(args.session_timeout)
+        os.environ['DGB_COMMAND_TIMEOUT'] = str(args.command_timeout)
+        os.environ['DGB_HANDLER_THREADS'] = str(args.handler_threads)
 
         uvicorn.run(
             "dgb.server.app:app",
@@ -78,17 +93,13 @@ def main():
             reload=True
         )
     else:
-        # In normal mode, create app directly and handle shutdown
-        app = create_app(session_timeout=args.session_timeout)
-
-        def signal_handler(sig, frame):
-            logger.info("Shutting down...")
-            # Close all sessions
-            app.state.session_manager.close_all_sessions()
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # In normal mode, create app directly. Uvicorn handles SIGINT/SIGTERM
+        # and runs the app's shutdown hooks, which close all sessions.
+        app = create_app(
+            session_timeout=args.session_timeout,
+            command_timeout=args.command_timeout,
+            handler_threads=args.handler_threads
+        )
 
         uvicorn.run(
             app,
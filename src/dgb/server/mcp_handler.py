@@ -7,7 +7,8 @@ Handles the MCP protocol methods:
 - tools/call: Execute a debugging tool
 """
 
-from typing import Any
+from typing import Any, Callable, Optional
+import json
 import logging
 
 from dgb.server.session_manager import SessionManager
@@ -20,6 +21,31 @@ from dgb.server import tools
 
 logger = logging.getLogger(__name__)
 
+# Field types of requests that JSONRPCRequest accepts without coercion
+_PLAIN_ID_TYPES = (str, int, type(None))
+_PLAIN_PARAMS_TYPES = (dict, type(None))
+
+
+def _success_response(request_id, result: Any) -> dict:
+    """Build a JSON-RPC success response.
+
+    Equivalent to JSONRPCResponse(id=..., result=...).model_dump(exclude_none=True),
+    without building and dumping a model for the fixed envelope.
+
+    Args:
+        request_id: ID of the request being answered
+        result: Method result
+
+    Returns:
+        JSON-RPC response dict
+    """
+    response = {"jsonrpc": "2.0"}
+    if request_id is not None:
+        response["id"] = request_id
+    if result is not None:
+        response["result"] = result
+    return response
+
 
 class MCPHandler:
     """Handles MCP protocol JSON-RPC requests."""
@@ -37,6 +63,9 @@ class MCPHandler:
             version="0.1.0"
         )
 
+        # The tool registry is static, so the tools/list result is dumped once
+        self._tools_list_result = ToolsListResult(tools=tools.get_all_tools()).model_dump()
+
     def handle_request(self, request_data: dict) -> dict:
         """Handle a JSON-RPC request.
 
@@ -47,7 +76,16 @@ class MCPHandler:
             JSON-RPC response dict
         """
         try:
-            request = JSONRPCRequest(**request_data)
+            # tools/list is the most frequent call and ignores its params, so
+            # well-formed requests for it skip building the request model
+            if (type(request_data) is dict
+                    and request_data.get('method') == "tools/list"
+                    and type(request_data.get('id')) in _PLAIN_ID_TYPES
+                    and type(request_data.get('jsonrpc', "2.0")) is str
+                    and type(request_data.get('params')) in _PLAIN_PARAMS_TYPES):
+                return _success_response(request_data.get('id'), self._handle_tools_list(None))
+
+            request = JSONRPCRequest.model_validate(request_data)
 
             # Dispatch to handler based on method
             if request.method == "initialize":
@@ -68,11 +106,7 @@ class MCPHandler:
                 return response.model_dump(exclude_none=True)
 
             # Success response
-            response = JSONRPCResponse(
-                id=request.id,
-                result=result
-            )
-            return response.model_dump(exclude_none=True)
+            return _success_response(request.id, result)
 
         except Exception as e:
             logger.error(f"Error handling request: {e}", exc_info=True)
@@ -114,19 +148,17 @@ class MCPHandler:
 
         return result.model_dump()
 
-    def _handle_tools_list(self, request: JSONRPCRequest) -> dict:
+    def _handle_tools_list(self, request: Optional[JSONRPCRequest]) -> dict:
         """Handle tools/list method.
 
         Args:
-            request: JSON-RPC request
+            request: JSON-RPC request (unused - tools/list takes no params;
+                None when the request wasn't validated into a model)
 
         Returns:
-            ToolsListResult dict
+            ToolsListResult dict (shared - don't modify it)
         """
-        all_tools = tools.get_all_tools()
-
-        result = ToolsListResult(tools=all_tools)
-        return result.model_dump()
+        return self._tools_list_result
 
     def _handle_tools_call(self, request: JSONRPCRequest) -> dict:
         """Handle tools/call method.
@@ -158,123 +190,13 @@ class MCPHandler:
             )
             return result.model_dump()
 
-        # Format successful result
-        # Build a text response
-        text_lines = []
-
-        # Special formatting based on tool
-        if params.name == "debugger_create_session":
-            text_lines.append(f"✓ Session created: {tool_result['session_id']}")
-            text_lines.append(f"Status: {tool_result['status']}")
-
-        elif params.name == "debugger_run" or params.name == "debugger_continue" or params.name == "debugger_step":
-            # Get state from top level (debugger_run returns state, stop_reason, stop_address at top level)
-            state = tool_result.get('state', 'unknown')
-            stop_reason = tool_result.get('stop_reason')
-            stop_address = tool_result.get('stop_address')
-
-            if state == 'stopped' or stop_reason:
-                # Stopped state
-                reason = stop_reason or 'breakpoint'
-                text_lines.append(f"✓ Stopped: {reason}")
-                if stop_address:
-                    text_lines.append(f"Address: {stop_address}")
-            else:
-                # Running or other state
-                text_lines.append(f"✓ State: {state}")
-
-        elif params.name == "debugger_set_breakpoint":
-            bp_id = tool_result.get('breakpoint_id')
-            bp_status = tool_result.get('status', 'active')
-
-            if bp_status == 'pending':
-                # Pending breakpoint
-                location = tool_result.get('location', '')
-                message = tool_result.get('message', '')
-                text_lines.append(f"✓ Breakpoint {bp_id} set (pending): {location}")
-                if message:
-                    text_lines.append(f"  {message}")
-            else:
-                # Active breakpoint
-                address = tool_result.get('address')
-                location = ""
-                if tool_result.get('file') and tool_result.get('line'):
-                    location = f" ({tool_result['file']}:{tool_result['line']})"
-                text_lines.append(f"✓ Breakpoint {bp_id} set at {address}{location}")
-
-        elif params.name == "debugger_list_breakpoints":
-            breakpoints = tool_result.get('breakpoints', [])
-            if not breakpoints:
-                text_lines.append("No breakpoints set")
-            else:
-                text_lines.append(f"Breakpoints ({len(breakpoints)}):")
-                for bp in breakpoints:
-                    bp_id = bp['breakpoint_id']
-                    bp_status = bp.get('status', 'active')
-
-                    if bp_status == 'pending':
-                        # Pending breakpoint - no address yet
-                        location = bp.get('location', '')
-                        text_lines.append(f"  {bp_id}: {location} - PENDING")
-                    else:
-                        # Active breakpoint
-                        address = bp['address']
-                        location = bp.get('location', '')
-                        status = "enabled" if bp['enabled'] else "disabled"
-                        hits = bp['hit_count']
-                        text_lines.append(f"  {bp_id}: {address} {location} - {status} (hit {hits}x)")
-
-        elif params.name == "debugger_get_registers":
-            registers = tool_result.get('registers', {})
-            text_lines.append("Registers:")
-            for reg, value in registers.items():
-                text_lines.append(f"  {reg:6s} = {value}")
-
-        elif params.name == "debugger_list_modules":
-            modules = tool_result.get('modules', [])
-            text_lines.append(f"Loaded modules ({len(modules)}):")
-            for mod in modules:
-                debug_info = "DWARF 2" if mod['has_debug_info'] else "no debug"
-                text_lines.append(f"  {mod['base_address']}  {mod['name']:30s}  ({debug_info})")
-
-        elif params.name == "debugger_get_source":
-            file = tool_result.get('file')
-            lines = tool_result.get('lines', [])
-            text_lines.append(f"Source: {file}")
-            text_lines.append("-" * 60)
-            for line_info in lines:
-                marker = ">>>" if line_info.get('is_current') else "   "
-                text_lines.append(f"{marker} {line_info['line_number']:4d} | {line_info['content']}")
-
-        elif params.name == "debugger_list_variables":
-            import json
-            variables = tool_result.get('variables', [])
-            count = tool_result.get('count', 0)
-
-            if count == 0:
-                text_lines.append("No variables in current scope")
-            else:
-                text_lines.append(f"Variables ({count}):")
-                for var in variables:
-                    name = var.get('name', '?')
-                    type_name = var.get('type', '?')
-                    value = var.get('value', '?')
-                    location = var.get('location', '?')
-                    text_lines.append(f"  {name:20s} = {value:30s} ({type_name}, {location})")
-
-                # Include JSON for testing/programmatic access
-                text_lines.append("")
-                text_lines.append("JSON:")
-                text_lines.append("```json")
-                text_lines.append(json.dumps(tool_result, indent=2))
-                text_lines.append("```")
-
-        elif params.name == "debugger_close_session":
-            text_lines.append(f"✓ {tool_result.get('message', 'Session closed')}")
-
+        # Format successful result as text, with tool-specific formatting
+        formatter = _RESULT_FORMATTERS.get(params.name)
+        if formatter:
+            text_lines = formatter(tool_result)
         else:
             # Generic success message
-            text_lines.append(f"✓ {params.name} completed successfully")
+            text_lines = [f"✓ {params.name} completed successfully"]
 
         # Join all lines
         text_response = "\n".join(text_lines)
@@ -284,3 +206,164 @@ class MCPHandler:
             isError=False
         )
         return result.model_dump()
+
+
+# Result formatters for tools/call. Each one turns a successful tool result
+# into the lines of the text response.
+
+def _format_create_session(tool_result: dict) -> list[str]:
+    """Format a debugger_create_session result."""
+    return [
+        f"✓ Session created: {tool_result['session_id']}",
+        f"Status: {tool_result['status']}"
+    ]
+
+
+def _format_execution(tool_result: dict) -> list[str]:
+    """Format a debugger_run, debugger_continue or debugger_step result."""
+    text_lines = []
+
+    # Get state from top level (debugger_run returns state, stop_reason, stop_address at top level)
+    state = tool_result.get('state', 'unknown')
+    stop_reason = tool_result.get('stop_reason')
+    stop_address = tool_result.get('stop_address')
+
+    if state == 'stopped' or stop_reason:
+        # Stopped state
+        reason = stop_reason or 'breakpoint'
+        text_lines.append(f"✓ Stopped: {reason}")
+        if stop_address:
+            text_lines.append(f"Address: {stop_address}")
+    else:
+        # Running or other state
+        text_lines.append(f"✓ State: {state}")
+
+    return text_lines
+
+
+def _format_set_breakpoint(tool_result: dict) -> list[str]:
+    """Format a debugger_set_breakpoint result."""
+    text_lines = []
+
+    bp_id = tool_result.get('breakpoint_id')
+    bp_status = tool_result.get('status', 'active')
+
+    if bp_status == 'pending':
+        # Pending breakpoint
+        location = tool_result.get('location', '')
+        message = tool_result.get('message', '')
+        text_lines.append(f"✓ Breakpoint {bp_id} set (pending): {location}")
+        if message:
+            text_lines.append(f"  {message}")
+    else:
+        # Active breakpoint
+        address = tool_result.get('address')
+        location = ""
+        if tool_result.get('file') and tool_result.get('line'):
+            location = f" ({tool_result['file']}:{tool_result['line']})"
+        text_lines.append(f"✓ Breakpoint {bp_id} set at {address}{location}")
+
+    return text_lines
+
+
+def _format_list_breakpoints(tool_result: dict) -> list[str]:
+    """Format a debugger_list_breakpoints result."""
+    text_lines = []
+
+    breakpoints = tool_result.get('breakpoints', [])
+    if not breakpoints:
+        text_lines.append("No breakpoints set")
+    else:
+        text_lines.append(f"Breakpoints ({len(breakpoints)}):")
+        text_lines.extend(map(_format_breakpoint_line, breakpoints))
+
+    return text_lines
+
+
+def _format_breakpoint_line(bp: dict) -> str:
+    """Format one breakpoint of a debugger_list_breakpoints result."""
+    bp_id = bp['breakpoint_id']
+    location = bp.get('location', '')
+
+    if bp.get('status', 'active') == 'pending':
+        # Pending breakpoint - no address yet
+        return f"  {bp_id}: {location} - PENDING"
+
+    # Active breakpoint
+    status = "enabled" if bp['enabled'] else "disabled"
+    return f"  {bp_id}: {bp['address']} {location} - {status} (hit {bp['hit_count']}x)"
+
+
+def _format_registers(tool_result: dict) -> list[str]:
+    """Format a debugger_get_registers result."""
+    registers = tool_result.get('registers', {})
+    text_lines = ["Registers:"]
+    text_lines.extend(f"  {reg:6s} = {value}" for reg, value in registers.items())
+    return text_lines
+
+
+def _format_modules(tool_result: dict) -> list[str]:
+    """Format a debugger_list_modules result."""
+    modules = tool_result.get('modules', [])
+    text_lines = [f"Loaded modules ({len(modules)}):"]
+    text_lines.extend(
+        f"  {mod['base_address']}  {mod['name']:30s}  "
+        f"({'DWARF 2' if mod['has_debug_info'] else 'no debug'})"
+        for mod in modules
+    )
+    return text_lines
+
+
+def _format_source(tool_result: dict) -> list[str]:
+    """Format a debugger_get_source result."""
+    file = tool_result.get('file')
+    lines = tool_result.get('lines', [])
+    text_lines = [f"Source: {file}", "-" * 60]
+    text_lines.extend(
+        f"{'>>>' if line_info.get('is_current') else '   '} "
+        f"{line_info['line_number']:4d} | {line_info['content']}"
+        for line_info in lines
+    )
+    return text_lines
+
+
+def _format_variables(tool_result: dict) -> list[str]:
+    """Format a debugger_list_variables result."""
+    variables = tool_result.get('variables', [])
+    count = tool_result.get('count', 0)
+
+    if count == 0:
+        return ["No variables in current scope"]
+
+    text_lines = [f"Variables ({count}):"]
+    text_lines.extend(
+        f"  {var.get('name', '?'):20s} = {var.get('value', '?'):30s} "
+        f"({var.get('type', '?')}, {var.get('location', '?')})"
+        for var in variables
+    )
+
+    # Include JSON for testing/programmatic access
+    text_lines += ["", "JSON:", "```json", json.dumps(tool_result, indent=2), "```"]
+    return text_lines
+
+
+def _format_close_session(tool_result: dict) -> list[str]:
+    """Format a debugger_close_session result."""
+    return [f"✓ {tool_result.get('message', 'Session closed')}"]
+
+
+# Tool name -> formatter used by MCPHandler._handle_tools_call. Tools without
+# one get a generic success message.
+_RESULT_FORMATTERS: dict[str, Callable[[dict], list[str]]] = {
+    'debugger_create_session': _format_create_session,
+    'debugger_run': _format_execution,
+    'debugger_continue': _format_execution,
+    'debugger_step': _format_execution,
+    'debugger_set_breakpoint': _format_set_breakpoint,
+    'debugger_list_breakpoints': _format_list_breakpoints,
+    'debugger_get_registers': _format_registers,
+    'debugger_list_modules': _format_modules,
+    'debugger_get_source': _format_source,
+    'debugger_list_variables': _format_variables,
+    'debugger_close_session': _format_close_session,
+}
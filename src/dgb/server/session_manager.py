@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 
 from dgb.debugger.core import Debugger
+from dgb.server.debugger_wrapper import DEFAULT_COMMAND_TIMEOUT
 from dgb.server.source_resolver import SourceResolver
 
 
@@ -25,21 +26,18 @@ class DebuggerSession:
     source_resolver: SourceResolver
     event_thread: Optional[threading.Thread] = None
     debugger_wrapper: Optional[Any] = None  # DebuggerWrapper instance (avoid circular import)
-    lock: threading.Lock = None
     created_at: float = 0.0
-    last_accessed: float = 0.0
+    last_accessed: float = 0.0  # time.monotonic() of the last access
     is_running: bool = False
 
     def __post_init__(self):
-        if self.lock is None:
-            self.lock = threading.Lock()
         if self.created_at == 0.0:
             self.created_at = time.time()
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic()
 
     def touch(self):
         """Update last accessed time."""
-        self.last_accessed = time.time()
+        self.last_accessed = time.monotonic()
 
     def cleanup(self):
         """Clean up session resources.
@@ -51,6 +49,10 @@ class DebuggerSession:
         try:
             print(f"[Session.cleanup] Starting fast cleanup for session", flush=True)
 
+            # Fail commands still waiting for the debugger thread
+            if self.debugger_wrapper:
+                self.debugger_wrapper.abandon()
+
             if self.debugger:
                 # Signal the event loop to quit FIRST
                 self.debugger.context.should_quit = True
@@ -97,15 +99,28 @@ class SessionManager:
     - Thread-safe access to sessions
     """
 
-    def __init__(self, session_timeout: float = 3600.0):
+    def __init__(self, session_timeout: float = 3600.0,
+                 command_timeout: float = DEFAULT_COMMAND_TIMEOUT):
         """Initialize session manager.
 
         Args:
             session_timeout: Session timeout in seconds (default 1 hour)
+            command_timeout: Time to wait for a debugger command in seconds
+                (default 30 seconds)
         """
+        # Copy-on-write: the dict is replaced, never modified, so lookups can
+        # read it without taking the lock. The lock serializes writers.
         self.sessions: Dict[str, DebuggerSession] = {}
         self.lock = threading.Lock()
         self.session_timeout = session_timeout
+        self.command_timeout = command_timeout
+        # Source resolvers shared by sessions with the same source directories,
+        # so their file caches are too: source_dirs -> [resolver, session count].
+        # Guarded by self.lock.
+        self._source_resolvers: Dict[tuple, list] = {}
+        # Closes expired sessions; started with the first session
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._cleanup_wakeup = threading.Event()
 
     def create_session(self, executable_path: str, args: Optional[list[str]] = None,
                       source_dirs: Optional[list[str]] = None) -> DebuggerSession:
@@ -132,22 +147,19 @@ class SessionManager:
         # Create debugger instance
         debugger = Debugger(executable_path)
 
-        # Create source resolver
-        source_resolver = SourceResolver()
-        if source_dirs:
-            for src_dir in source_dirs:
-                source_resolver.add_source_directory(src_dir)
-
-        # Create session
-        session = DebuggerSession(
-            session_id=session_id,
-            debugger=debugger,
-            source_resolver=source_resolver
-        )
-
-        # Store session
+        # Store session, sharing a source resolver with sessions that search
+        # the same source directories
         with self.lock:
-            self.sessions[session_id] = session
+            session = DebuggerSession(
+                session_id=session_id,
+                debugger=debugger,
+                source_resolver=self._acquire_source_resolver(source_dirs)
+            )
+            self.sessions = {**self.sessions, session_id: session}
+            self._start_cleanup_thread()
+
+        # The cleanup thread sleeps indefinitely while there are no sessions
+        self._cleanup_wakeup.set()
 
         return session
 
@@ -160,11 +172,10 @@ class SessionManager:
         Returns:
             DebuggerSession if found, None otherwise
         """
-        with self.lock:
-            session = self.sessions.get(session_id)
-            if session:
-                session.touch()
-            return session
+        session = self.sessions.get(session_id)
+        if session:
+            session.touch()
+        return session
 
     def close_session(self, session_id: str) -> bool:
         """Close and remove a session.
@@ -176,15 +187,21 @@ class SessionManager:
             True if session was found and closed, False otherwise
         """
         with self.lock:
-            session = self.sessions.pop(session_id, None)
-            if session:
-                session.cleanup()
-                return True
-            return False
+            sessions = dict(self.sessions)
+            session = sessions.pop(session_id, None)
+            if not session:
+                return False
+            self.sessions = sessions
+            self._release_source_resolver(session.source_resolver)
+
+        # Cleanup terminates the process and waits for its thread, so do it
+        # without holding the lock
+        session.cleanup()
+        return True
 
     def cleanup_expired_sessions(self):
         """Remove sessions that have exceeded the timeout."""
-        current_time = time.time()
+        current_time = time.monotonic()
         expired_sessions = []
 
         with self.lock:
@@ -192,25 +209,100 @@ class SessionManager:
                 if current_time - session.last_accessed > self.session_timeout:
                     expired_sessions.append(session_id)
 
-            for session_id in expired_sessions:
-                session = self.sessions.pop(session_id)
-                session.cleanup()
+            if expired_sessions:
+                sessions = dict(self.sessions)
+                expired_sessions = [sessions.pop(session_id) for session_id in expired_sessions]
+                self.sessions = sessions
+                for session in expired_sessions:
+                    self._release_source_resolver(session.source_resolver)
+
+        # Cleanup is slow, so it runs once the sessions are unpublished
+        for session in expired_sessions:
+            session.cleanup()
 
         return len(expired_sessions)
 
     def close_all_sessions(self):
         """Close all active sessions."""
         with self.lock:
-            for session in self.sessions.values():
-                session.cleanup()
-            self.sessions.clear()
+            sessions = self.sessions
+            self.sessions = {}
+            self._source_resolvers.clear()
+
+        for session in sessions.values():
+            session.cleanup()
+
+    def _start_cleanup_thread(self):
+        """Start the thread that closes expired sessions, if not running yet.
+
+        Must be called with self.lock held.
+        """
+        if self._cleanup_thread is None:
+            self._cleanup_thread = threading.Thread(
+                target=self._cleanup_loop,
+                name='session-cleanup',
+                daemon=True
+            )
+            self._cleanup_thread.start()
+
+    def _cleanup_loop(self):
+        """Close expired sessions, sleeping until the next one could expire.
+
+        Accessing a session only pushes its expiry back, so the earliest
+        possible expiry is the oldest last_accessed plus the timeout. Nothing
+        can expire sooner, except a new session after the manager was empty,
+        which create_session signals through self._cleanup_wakeup.
+        """
+        while True:
+            self._cleanup_wakeup.clear()
+            self.cleanup_expired_sessions()
+
+            sessions = self.sessions
+            if sessions:
+                oldest_access = min(session.last_accessed for session in sessions.values())
+                delay = max(0.0, oldest_access + self.session_timeout - time.monotonic())
+            else:
+                delay = None
+            self._cleanup_wakeup.wait(delay)
+
+    def _acquire_source_resolver(self, source_dirs: Optional[list[str]]) -> SourceResolver:
+        """Get the source resolver for a set of source directories.
+
+        Must be called with self.lock held.
+
+        Args:
+            source_dirs: Additional source directories to search
+
+        Returns:
+            SourceResolver shared with other sessions using the same directories
+        """
+        key = tuple(source_dirs or ())
+        entry = self._source_resolvers.get(key)
+        if entry is None:
+            source_resolver = SourceResolver()
+            for src_dir in key:
+                source_resolver.add_source_directory(src_dir)
+            entry = self._source_resolvers[key] = [source_resolver, 0]
+        entry[1] += 1
+        return entry[0]
+
+    def _release_source_resolver(self, source_resolver: SourceResolver):
+        """Drop a session's reference to its source resolver.
+
+        The resolver (and its file cache) is discarded once no session uses it.
+        Must be called with self.lock held.
+        """
+        for key, entry in self._source_resolvers.items():
+            if entry[0] is source_resolver:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    del self._source_resolvers[key]
+                return
 
     def get_session_count(self) -> int:
         """Get the number of active sessions."""
-        with self.lock:
-            return len(self.sessions)
+        return len(self.sessions)
 
     def get_all_session_ids(self) -> list[str]:
         """Get all active session IDs."""
-        with self.lock:
-            return list(self.sessions.keys())
+        return list(self.sessions)
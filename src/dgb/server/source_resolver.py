@@ -4,16 +4,37 @@ Source code loading and resolution functionality.
 Extracted from ui/source_display.py for use in MCP server.
 """
 
+import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 
+# Number of source files kept in memory; the least recently used are dropped
+SOURCE_CACHE_SIZE = 64
+
+# How long a file that wasn't found anywhere is reported missing without
+# searching again, in seconds, and how many such files are remembered
+MISSING_FILE_TTL = 5.0
+MISSING_FILE_CACHE_SIZE = 256
+
+
 class SourceResolver:
-    """Handles loading and resolving source files."""
+    """Handles loading and resolving source files.
+
+    A resolver may be shared by several sessions, so it is safe to use from
+    multiple threads.
+    """
 
     def __init__(self):
-        self.source_cache = {}  # {file_path: list of lines}
+        self.source_cache = OrderedDict()  # {file_path: list of stripped lines}, oldest first
         self.source_directories = []  # Additional directories to search for sources
+        self._source_directory_strs = []  # source_directories as strings, for os.path
+        # {file_path: time.monotonic() until which it's reported missing}, oldest first
+        self._missing = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def add_source_directory(self, directory: str):
         """Add a directory to search for source files.
@@ -24,6 +45,10 @@ class SourceResolver:
         path = Path(directory)
         if path.exists() and path.is_dir():
             self.source_directories.append(path)
+            self._source_directory_strs.append(str(path))
+            # A missing file may be in the new directory
+            with self._cache_lock:
+                self._missing.clear()
 
     def load_source_file(self, file_path: str) -> Optional[list[str]]:
         """Load a source file.
@@ -32,29 +57,50 @@ class SourceResolver:
             file_path: Path to source file
 
         Returns:
-            List of lines if successful, None otherwise
+            List of lines, without trailing whitespace, if successful;
+            None otherwise
         """
-        if file_path in self.source_cache:
-            return self.source_cache[file_path]
-
-        # Try to find the file
-        paths_to_try = [Path(file_path)]
-
-        # Try source directories with the basename
-        basename = Path(file_path).name
-        for src_dir in self.source_directories:
-            paths_to_try.append(src_dir / basename)
-
+        with self._cache_lock:
+            lines = self.source_cache.get(file_path)
+            if lines is not None:
+                self.source_cache.move_to_end(file_path)
+                return lines
+            missing_until = self._missing.get(file_path)
+            if missing_until is not None:
+                if time.monotonic() < missing_until:
+                    return None
+                del self._missing[file_path]
+
+        # Try to find the file, then try source directories with the basename
+        paths_to_try = [file_path]
+        basename = os.path.basename(file_path)
+        for src_dir in self._source_directory_strs:
+            paths_to_try.append(os.path.join(src_dir, basename))
+
+        found = False
         for path in paths_to_try:
-            if path.exists():
+            if os.path.isfile(path):
+                found = True
                 try:
                     with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                        lines = f.readlines()
+                        # Strip once here instead of on every display
+                        lines = [line.rstrip() for line in f]
+                    with self._cache_lock:
                         self.source_cache[file_path] = lines
-                        return lines
+                        if len(self.source_cache) > SOURCE_CACHE_SIZE:
+                            self.source_cache.popitem(last=False)
+                    return lines
                 except Exception:
                     pass
 
+        # Only remember files that don't exist - one that failed to open may
+        # well be readable next time
+        if not found:
+            with self._cache_lock:
+                self._missing[file_path] = time.monotonic() + MISSING_FILE_TTL
+                self._missing.move_to_end(file_path)
+                if len(self._missing) > MISSING_FILE_CACHE_SIZE:
+                    self._missing.popitem(last=False)
         return None
 
     def get_source_lines(self, file_path: str, line: int, context_lines: int = 5) -> Optional[dict]:
@@ -84,7 +130,7 @@ class SourceResolver:
             if line_idx < len(lines):
                 result_lines.append({
                     'line_number': line_num,
-                    'content': lines[line_idx].rstrip(),
+                    'content': lines[line_idx],
                     'is_current': line_num == line
                 })
 
@@ -121,7 +167,7 @@ class SourceResolver:
             if line_idx < len(lines):
                 result_lines.append({
                     'line_number': line_num,
-                    'content': lines[line_idx].rstrip()
+                    'content': lines[line_idx]
                 })
 
         return {
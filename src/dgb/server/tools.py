@@ -217,7 +217,7 @@ def debugger_run(session_manager: SessionManager, args: dict) -> dict:
         }
 
     # Create wrapper for command processing
-    wrapper = DebuggerWrapper(session.debugger)
+    wrapper = DebuggerWrapper(session.debugger, command_timeout=session_manager.command_timeout)
     wrapper.running = True
     wrapper.thread = thread
 
@@ -281,7 +281,7 @@ def debugger_continue(session_manager: SessionManager, args: dict) -> dict:
     print(f"[debugger_continue] State changed to running, waiting for next stop event...", flush=True)
 
     # Wait for process to stop at next breakpoint or exit
-    timeout = 10.0
+    timeout = session_manager.command_timeout
     start_time = time.time()
     while time.time() - start_time < timeout:
         if session.debugger.context.is_stopped():
@@ -364,7 +364,7 @@ def debugger_step(session_manager: SessionManager, args: dict) -> dict:
     print(f"[debugger_step] State set to running with step mode, waiting for step to complete...", flush=True)
 
     # Wait for step to complete (process should stop again)
-    timeout = 5.0
+    timeout = session_manager.command_timeout
     start_time = time.time()
     while time.time() - start_time < timeout:
         if session.debugger.context.is_stopped():
@@ -423,30 +423,27 @@ def debugger_set_breakpoint(session_manager: SessionManager, args: dict) -> dict
 
     if use_direct:
         # Set breakpoint directly on stopped debugger
-        success = session.debugger.set_breakpoint(location)
-        if success:
-            bp_list = session.debugger.breakpoint_manager.get_all_breakpoints()
-            if bp_list:
-                last_bp = bp_list[-1]
-                result = {
-                    'success': True,
-                    'breakpoint_id': f"bp_{last_bp.id}",
-                    'status': last_bp.status
-                }
-
-                if last_bp.status == "active":
-                    result.update({
-                        'address': f"0x{last_bp.address:08x}",
-                        'file': last_bp.file,
-                        'line': last_bp.line,
-                        'module_name': last_bp.module_name
-                    })
-                else:  # pending
-                    result.update({
-                        'location': last_bp.pending_location,
-                        'message': 'Breakpoint pending - will activate when module loads'
-                    })
-                return result
+        bp = session.debugger.set_breakpoint(location)
+        if bp:
+            result = {
+                'success': True,
+                'breakpoint_id': f"bp_{bp.id}",
+                'status': bp.status
+            }
+
+            if bp.status == "active":
+                result.update({
+                    'address': f"0x{bp.address:08x}",
+                    'file': bp.file,
+                    'line': bp.line,
+                    'module_name': bp.module_name
+                })
+            else:  # pending
+                result.update({
+                    'location': bp.pending_location,
+                    'message': 'Breakpoint pending - will activate when module loads'
+                })
+            return result
         return {'success': False, 'error': 'Failed to set breakpoint'}
 
     # Use command queue for running debugger
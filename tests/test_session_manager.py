@@ -0,0 +1,108 @@
+"""
+Unit tests for SessionManager.
+
+Covers source resolver sharing between sessions and the thread that closes
+expired sessions. Sessions here never start a process, so closing them is
+immediate.
+"""
+
+import sys
+import time
+
+import pytest
+
+from dgb.server.session_manager import SessionManager
+
+
+# Any existing file will do - the sessions never start it
+EXECUTABLE = sys.executable
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll condition() until it's true or the timeout runs out."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def session_manager():
+    """Session manager whose sessions are closed after the test."""
+    manager = SessionManager()
+    yield manager
+    manager.close_all_sessions()
+
+
+@pytest.mark.session
+def test_sessions_share_source_resolver(session_manager, tmp_path):
+    """Test that sessions with the same source directories share a resolver."""
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+
+    first = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    second = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    other = session_manager.create_session(EXECUTABLE, source_dirs=[str(other_dir)])
+
+    assert first.source_resolver is second.source_resolver
+    assert first.source_resolver is not other.source_resolver
+
+
+@pytest.mark.session
+def test_source_resolver_released_with_last_session(session_manager, tmp_path):
+    """Test that a shared resolver is dropped once its last session closes."""
+    first = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    second = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    resolver = first.source_resolver
+
+    assert session_manager.close_session(first.session_id)
+    third = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    assert third.source_resolver is resolver
+
+    assert session_manager.close_session(second.session_id)
+    assert session_manager.close_session(third.session_id)
+    fourth = session_manager.create_session(EXECUTABLE, source_dirs=[str(tmp_path)])
+    assert fourth.source_resolver is not resolver
+
+
+@pytest.mark.session
+def test_expired_session_is_closed():
+    """Test that an idle session is closed once the timeout runs out."""
+    manager = SessionManager(session_timeout=0.2)
+    session = manager.create_session(EXECUTABLE)
+
+    assert wait_until(lambda: manager.get_session_count() == 0)
+    assert manager.get_session(session.session_id) is None
+
+
+@pytest.mark.session
+def test_accessed_session_is_kept():
+    """Test that accessing a session pushes its expiry back."""
+    manager = SessionManager(session_timeout=0.5)
+    session = manager.create_session(EXECUTABLE)
+
+    try:
+        # Keep it busy for well past the timeout
+        for _ in range(10):
+            time.sleep(0.1)
+            assert manager.get_session(session.session_id) is not None
+    finally:
+        manager.close_all_sessions()
+
+
+@pytest.mark.session
+def test_cleanup_thread_wakes_for_new_session():
+    """Test that a session created after the manager emptied still expires.
+
+    With no sessions the cleanup thread sleeps without a timeout, so
+    create_session has to wake it.
+    """
+    manager = SessionManager(session_timeout=0.2)
+    manager.create_session(EXECUTABLE)
+    assert wait_until(lambda: manager.get_session_count() == 0)
+
+    manager.create_session(EXECUTABLE)
+
+    assert wait_until(lambda: manager.get_session_count() == 0)
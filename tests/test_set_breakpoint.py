@@ -0,0 +1,70 @@
+"""
+Unit tests for Debugger.set_breakpoint.
+
+Uses a BreakpointManager over an in-memory process, so no process is started.
+"""
+
+import sys
+
+import pytest
+
+from dgb.debugger.breakpoint_manager import BreakpointManager
+from dgb.debugger.core import Debugger
+
+
+class FakeProcessController:
+    """Process controller backed by a zero-filled bytearray."""
+
+    def __init__(self, size=0x10000):
+        self.memory = bytearray(size)
+
+    def read_memory(self, address, size):
+        return bytes(self.memory[address:address + size])
+
+    def write_memory(self, address, data):
+        self.memory[address:address + len(data)] = data
+
+
+@pytest.fixture
+def debugger():
+    """Debugger with a breakpoint manager over fake process memory."""
+    debugger = Debugger(sys.executable)
+    debugger.breakpoint_manager = BreakpointManager(
+        FakeProcessController(),
+        debugger.module_manager
+    )
+    return debugger
+
+
+@pytest.mark.breakpoint
+def test_returns_new_breakpoint(debugger):
+    """Test that the breakpoint just set is returned, not the last one by address."""
+    high = debugger.set_breakpoint("0x2000")
+    low = debugger.set_breakpoint("0x1000")
+
+    assert high.address == 0x2000
+    assert low.address == 0x1000
+    assert low.id == high.id + 1
+    assert low.status == "active"
+
+
+@pytest.mark.breakpoint
+def test_returns_pending_breakpoint(debugger):
+    """Test that a breakpoint on an unloaded source file is returned pending."""
+    bp = debugger.set_breakpoint("missing.c:10")
+
+    assert bp is not None
+    assert bp.status == "pending"
+    assert bp.pending_location == "missing.c:10"
+
+
+@pytest.mark.breakpoint
+def test_returns_none_on_failure(debugger):
+    """Test that None is returned when the location can't be parsed."""
+    assert debugger.set_breakpoint("nonsense") is None
+
+
+@pytest.mark.breakpoint
+def test_returns_none_before_start():
+    """Test that None is returned before the process is started."""
+    assert Debugger(sys.executable).set_breakpoint("0x1000") is None
@@ -0,0 +1,112 @@
+"""
+Unit tests for SourceResolver.
+
+Covers source file caching: stripped lines, LRU eviction and the cache of
+files that weren't found.
+"""
+
+import pytest
+
+from dgb.server import source_resolver
+from dgb.server.source_resolver import SourceResolver
+
+
+def write_source(directory, name, text="int main() {  \n    return 0;\t\n}\n"):
+    """Write a source file and return its path as a string."""
+    path = directory / name
+    path.write_text(text)
+    return str(path)
+
+
+@pytest.mark.source
+def test_lines_are_stripped(tmp_path):
+    """Test that loaded lines have no trailing whitespace."""
+    path = write_source(tmp_path, "main.c")
+
+    lines = SourceResolver().load_source_file(path)
+
+    assert lines == ["int main() {", "    return 0;", "}"]
+
+
+@pytest.mark.source
+def test_found_in_source_directory(tmp_path):
+    """Test that a file is found by basename in an added source directory."""
+    write_source(tmp_path, "main.c")
+    resolver = SourceResolver()
+    resolver.add_source_directory(str(tmp_path))
+
+    # The path the debug info recorded doesn't exist here
+    source = resolver.get_source_lines(str(tmp_path / "build" / "main.c"), 2, context_lines=1)
+
+    assert source is not None
+    assert [line["line_number"] for line in source["lines"]] == [1, 2, 3]
+    assert source["lines"][1]["is_current"]
+
+
+@pytest.mark.source
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test that the cache keeps only the most recently used files."""
+    monkeypatch.setattr(source_resolver, "SOURCE_CACHE_SIZE", 2)
+    a, b, c = (write_source(tmp_path, name) for name in ("a.c", "b.c", "c.c"))
+    resolver = SourceResolver()
+
+    resolver.load_source_file(a)
+    resolver.load_source_file(b)
+    resolver.load_source_file(a)  # a is now more recent than b
+    resolver.load_source_file(c)
+
+    assert list(resolver.source_cache) == [a, c]
+
+
+@pytest.mark.source
+def test_missing_file_is_remembered(tmp_path):
+    """Test that a missing file isn't searched for again right away."""
+    path = str(tmp_path / "late.c")
+    resolver = SourceResolver()
+
+    assert resolver.load_source_file(path) is None
+    write_source(tmp_path, "late.c")
+
+    # Still reported missing until the entry expires
+    assert resolver.load_source_file(path) is None
+
+
+@pytest.mark.source
+def test_missing_file_expires(tmp_path, monkeypatch):
+    """Test that a file that shows up later is found once the entry expires."""
+    monkeypatch.setattr(source_resolver, "MISSING_FILE_TTL", 0.0)
+    path = str(tmp_path / "late.c")
+    resolver = SourceResolver()
+
+    assert resolver.load_source_file(path) is None
+    write_source(tmp_path, "late.c")
+
+    assert resolver.load_source_file(path) is not None
+
+
+@pytest.mark.source
+def test_unreadable_file_is_not_remembered(tmp_path, monkeypatch):
+    """Test that a file that exists but can't be opened is retried."""
+    path = write_source(tmp_path, "main.c")
+    resolver = SourceResolver()
+
+    def failing_open(*args, **kwargs):
+        raise PermissionError("locked")
+
+    monkeypatch.setattr(source_resolver, "open", failing_open, raising=False)
+    assert resolver.load_source_file(path) is None
+    monkeypatch.undo()
+
+    assert resolver.load_source_file(path) is not None
+
+
+@pytest.mark.source
+def test_missing_files_are_bounded(tmp_path, monkeypatch):
+    """Test that only the most recent missing files are remembered."""
+    monkeypatch.setattr(source_resolver, "MISSING_FILE_CACHE_SIZE", 2)
+    resolver = SourceResolver()
+
+    for name in ("a.c", "b.c", "c.c"):
+        resolver.load_source_file(str(tmp_path / name))
+
+    assert list(resolver._missing) == [str(tmp_path / "b.c"), str(tmp_path / "c.c")]
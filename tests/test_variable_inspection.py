@@ -590,6 +590,75 @@ def test_variable_addresses(debug_session, mcp_client):
                 f"Address should be hex format, got {var['address']}"
 
 
+# ============================================================================
+# MULTIPLE STOP TESTS
+# ============================================================================
+
+@pytest.mark.inspection
+def test_variables_refresh_between_stops(debug_session, mcp_client):
+    """Test that variables are re-read at every stop, not reused from the last one.
+
+    functions.c calls level1(5) and level1(10), each going down to level3, so
+    the same functions stop twice with different values and frame bases.
+    """
+    session_id = debug_session("functions.exe")
+    mcp_client.call_tool("debugger_run", {"session_id": session_id})
+
+    for location in ("functions.c:13", "functions.c:4"):
+        bp_result = mcp_client.call_tool("debugger_set_breakpoint", {
+            "session_id": session_id,
+            "location": location
+        })
+        bp_text = extract_text_from_result(bp_result)
+        assert "breakpoint" in bp_text.lower(), f"Failed to set breakpoint at {location}: {bp_text}"
+
+    # (function stopped in, expected x) for each stop, in order
+    expected_stops = [("level1", "5"), ("level3", "6"), ("level1", "10"), ("level3", "11")]
+    for function, expected_x in expected_stops:
+        cont_result = mcp_client.call_tool("debugger_continue", {"session_id": session_id})
+        cont_text = extract_text_from_result(cont_result)
+        assert "breakpoint" in cont_text.lower() or "stopped" in cont_text.lower()
+
+        variables = get_variables(mcp_client, session_id)
+        x = find_variable(variables, "x")
+        assert x is not None, f"Variable 'x' not found in {function}"
+        assert x["value"] == expected_x, \
+            f"Expected x = {expected_x} in {function}, got {x['value']}"
+
+
+@pytest.mark.inspection
+def test_variables_refresh_after_step(debug_session, mcp_client):
+    """Test that registers are re-read after a step.
+
+    Locals are addressed from the frame base in EBP. Stepping out of level3
+    back into level2 restores level2's EBP, so x must change from level3's
+    value (6) to level2's (5).
+    """
+    session_id = debug_session("functions.exe")
+    mcp_client.call_tool("debugger_run", {"session_id": session_id})
+    set_breakpoint_and_continue(mcp_client, session_id, "functions.c:4")
+
+    variables = get_variables(mcp_client, session_id)
+    x = find_variable(variables, "x")
+    assert x is not None and x["value"] == "6"
+
+    # Step until back in level2 (the only function with a 'result' local
+    # here), listing variables at every stop on the way
+    for _ in range(50):
+        step_result = mcp_client.call_tool("debugger_step", {"session_id": session_id})
+        assert not step_result.get("isError"), f"Step failed: {step_result}"
+
+        variables = get_variables(mcp_client, session_id)
+        if find_variable(variables, "result") is not None:
+            break
+    else:
+        pytest.fail("Did not step back into level2 within 50 steps")
+
+    x = find_variable(variables, "x")
+    assert x is not None
+    assert x["value"] == "5", f"Expected level2's x = 5 after stepping out of level3, got {x['value']}"
+
+
 # ============================================================================
 # ERROR HANDLING TESTS
 # ============================================================================